@@ -1034,8 +1034,10 @@ async def query_project_docs(request: QueryRequest):
                     suggested_questions=suggested_questions,
                 )
 
-            # Get context from CSV engine
-            context, records = csv_engine.get_context_for_query(
+            # Get context from CSV engine. This can call the LLM and run the
+            # pandas code it generates, so it runs in a worker thread
+            context, records, pandas_query = await asyncio.to_thread(
+                csv_engine.get_context_for_query,
                 request.project_id,
                 request.query,
                 data_type
@@ -1053,7 +1055,7 @@ async def query_project_docs(request: QueryRequest):
                     query=request.query,
                     response=f"No {data_type} data found matching your query.",
                     sources=[],
-                    metadata={"intent": intent, "data_source": "csv", "pandas_query": getattr(csv_engine, 'last_generated_code', '')},
+                    metadata={"intent": intent, "data_source": "csv", "pandas_query": pandas_query},
                     suggested_questions=suggested_questions,
                 )
 
@@ -1108,7 +1110,7 @@ async def query_project_docs(request: QueryRequest):
                             "data_source": "csv",
                             "query_type": "aggregation",
                             "stats": first_record,
-                            "pandas_query": getattr(csv_engine, 'last_generated_code', '')
+                            "pandas_query": pandas_query
                         },
                         suggested_questions=suggested_questions,
                         conversation_state=updated_state,
@@ -1155,7 +1157,7 @@ async def query_project_docs(request: QueryRequest):
                             "data_source": "csv",
                             "query_type": "aggregation",
                             "stats": first_record,
-                            "pandas_query": getattr(csv_engine, 'last_generated_code', '')
+                            "pandas_query": pandas_query
                         },
                         suggested_questions=suggested_questions,
                         conversation_state=updated_state,
@@ -1203,7 +1205,7 @@ async def query_project_docs(request: QueryRequest):
             )
 
             # Get the generated pandas code if available
-            generated_pandas_code = getattr(csv_engine, 'last_generated_code', '')
+            generated_pandas_code = pandas_query
 
             return QueryResponse(
                 project_id=request.project_id,
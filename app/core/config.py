@@ -2,21 +2,161 @@
 Core configuration module for RepWise
 """
 import json
-from typing import List
-from pydantic_settings import BaseSettings
-from pydantic import Field, field_validator
-from pathlib import Path
+from typing import Dict, List, Tuple
+from dotenv import dotenv_values
+from pydantic_settings import BaseSettings, InitSettingsSource
+from pydantic import Field, PrivateAttr, field_validator
+from functools import cached_property, lru_cache
 
+# Re-exported for existing "from app.core.config import ..." callers
+from app.core.constants import (  # noqa: F401
+    PROJECT_DOC_FILES,
+    PROJECT_DOC_FILES_SETS,
+    PROJECT_DOC_FILE_INDEX,
+    MULTI_REPO_GOVERNANCE,
+    MultiRepoGovernance,
+    MODEL_REGISTRY,
+    ModelSpec,
+    classify_doc_path,
+    get_model_spec,
+)
 
-class Settings(BaseSettings):
+
+def _split_list_value(value: str) -> List[str]:
+    """
+    Split a comma- and/or whitespace-separated env value into items.
+
+    Uses str.split() with no separator, which strips and drops empty items
+    in C, instead of a regex split or a per-item strip/filter comprehension.
+    Single-value strings (the usual single-origin deploy) skip the replace.
+    """
+    if "," not in value:
+        return value.split()
+    return value.replace(",", " ").split()
+
+
+@lru_cache(maxsize=None)
+def _read_env_file(env_file: str) -> Dict[str, str]:
+    """
+    Parse an env file once per process (keys lowercased to match field names).
+
+    Empty values are dropped so they fall back to the field default, as
+    env_ignore_empty does for process env vars.
+    """
+    return {
+        key.lower(): value
+        for key, value in dotenv_values(env_file).items()
+        if value
+    }
+
+
+class _EnvFileSettings(BaseSettings):
+    """Base settings model that reads the .env file only once per process"""
+
+    class Config:
+        env_file = ".env"
+        case_sensitive = False
+        extra = "ignore"
+        # Empty env values fall back to the field default
+        env_ignore_empty = True
+        # Settings are read-only once loaded
+        frozen = True
+        # Defaults are already correctly typed; don't re-validate them
+        validate_default = False
+        # Build the core schema on first instantiation, not at import
+        defer_build = True
+        # Hand raw env strings to the field validators, which parse list
+        # values in one pass (JSON array or comma-separated)
+        enable_decoding = False
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls,
+        init_settings,
+        env_settings,
+        dotenv_settings,
+        file_secret_settings,
+    ):
+        # Same precedence as the default sources, but the .env values come
+        # from the memoized parse instead of re-reading the file
+        cached_dotenv = InitSettingsSource(
+            settings_cls, _read_env_file(settings_cls.model_config["env_file"])
+        )
+        return init_settings, env_settings, cached_dotenv, file_secret_settings
+
+
+class DeferredSettings(_EnvFileSettings):
+    """
+    Authentication and OAuth settings.
+
+    Only the auth routes and the user database need these, so they are kept
+    out of Settings and resolved lazily instead of on every Settings() call.
+    """
+
+    # Authentication Configuration
+    jwt_secret_key: str = Field(
+        default="your-secret-key-change-in-production-MUST-BE-SECURE-AND-RANDOM-987654321",
+        env="JWT_SECRET_KEY"
+    )
+    database_url: str = Field(
+        default="sqlite:///./auth.db",
+        env="DATABASE_URL"
+    )
+
+    # OAuth Configuration (Optional)
+    google_client_id: str = Field(
+        default="your-google-client-id-here",
+        env="GOOGLE_CLIENT_ID"
+    )
+    google_client_secret: str = Field(
+        default="your-google-client-secret-here",
+        env="GOOGLE_CLIENT_SECRET"
+    )
+    google_redirect_uri: str = Field(
+        default="http://localhost:3000/auth/callback/google",
+        env="GOOGLE_REDIRECT_URI"
+    )
+    github_oauth_client_id: str = Field(
+        default="your-github-client-id-here",
+        env="GITHUB_OAUTH_CLIENT_ID"
+    )
+    github_oauth_client_secret: str = Field(
+        default="your-github-client-secret-here",
+        env="GITHUB_OAUTH_CLIENT_SECRET"
+    )
+    github_oauth_redirect_uri: str = Field(
+        default="http://localhost:3000/auth/callback/github",
+        env="GITHUB_OAUTH_REDIRECT_URI"
+    )
+
+
+class _DeferredField:
+    """Settings attribute that resolves from DeferredSettings on first access"""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = getattr(instance.deferred, self.name)
+        # Cache on the instance; later lookups skip the descriptor entirely
+        instance.__dict__[self.name] = value
+        return value
+
+
+class Settings(_EnvFileSettings):
     """Application settings loaded from environment variables"""
 
     # GitHub Configuration
-    github_token: str = Field(..., env="GITHUB_TOKEN")
+    # Empty when unset (or set but empty); document extraction is then
+    # skipped instead of failing startup
+    github_token: str = Field(default="", env="GITHUB_TOKEN")
 
     # Ollama Configuration
     ollama_host: str = Field(default="http://localhost:11434", env="OLLAMA_HOST")
-    ollama_model: str = Field(default="mistral:latest", env="OLLAMA_MODEL")  # 7B model for better reasoning and improved performance
+    ollama_model: str = Field(default="mistral:latest", env="OLLAMA_MODEL")
 
     # ChromaDB Configuration
     chroma_persist_dir: str = Field(default="../chromadb", env="CHROMA_PERSIST_DIR")
@@ -37,27 +177,28 @@ class Settings(BaseSettings):
 
     # API Configuration
     api_prefix: str = Field(default="/api", env="API_PREFIX")
-    cors_origins: List[str] = Field(
-        default=[
+    # List settings are stored as tuples: immutable and safe to share without copying
+    cors_origins: Tuple[str, ...] = Field(
+        default=(
             "https://repowise.netlify.app",
             "https://tianna-unretractive-ellen.ngrok-free.dev",
             "http://localhost:3000",
             "http://localhost:5173",
             "https://repowise.github.io/RepoWise-website/",
             "https://repowise.github.io",
-        ],
+        ),
         env="CORS_ORIGINS",
     )
     cors_allow_credentials: bool = Field(
         default=True,
         env="CORS_ALLOW_CREDENTIALS",
     )
-    cors_allow_methods: List[str] = Field(
-        default=["OPTIONS", "GET", "POST", "PUT", "PATCH", "DELETE"],
+    cors_allow_methods: Tuple[str, ...] = Field(
+        default=("OPTIONS", "GET", "POST", "PUT", "PATCH", "DELETE"),
         env="CORS_ALLOW_METHODS",
     )
-    cors_allow_headers: List[str] = Field(
-        default=["Authorization", "Content-Type", "Accept", "Origin", "ngrok-skip-browser-warning"],
+    cors_allow_headers: Tuple[str, ...] = Field(
+        default=("Authorization", "Content-Type", "Accept", "Origin", "ngrok-skip-browser-warning"),
         env="CORS_ALLOW_HEADERS",
     )
 
@@ -69,50 +210,44 @@ class Settings(BaseSettings):
         default=60, env="RATE_LIMIT_BACKOFF_SECONDS"
     )
 
-    # Authentication Configuration
-    jwt_secret_key: str = Field(
-        default="your-secret-key-change-in-production-MUST-BE-SECURE-AND-RANDOM-987654321",
-        env="JWT_SECRET_KEY"
-    )
-    database_url: str = Field(
-        default="sqlite:///./auth.db",
-        env="DATABASE_URL"
-    )
-
-    # OAuth Configuration (Optional)
-    google_client_id: str = Field(
-        default="your-google-client-id-here",
-        env="GOOGLE_CLIENT_ID"
-    )
-    google_client_secret: str = Field(
-        default="your-google-client-secret-here",
-        env="GOOGLE_CLIENT_SECRET"
-    )
-    google_redirect_uri: str = Field(
-        default="http://localhost:3000/auth/callback/google",
-        env="GOOGLE_REDIRECT_URI"
-    )
-    github_oauth_client_id: str = Field(
-        default="your-github-client-id-here",
-        env="GITHUB_OAUTH_CLIENT_ID"
-    )
-    github_oauth_client_secret: str = Field(
-        default="your-github-client-secret-here",
-        env="GITHUB_OAUTH_CLIENT_SECRET"
-    )
-    github_oauth_redirect_uri: str = Field(
-        default="http://localhost:3000/auth/callback/github",
-        env="GITHUB_OAUTH_REDIRECT_URI"
-    )
+    # Authentication / OAuth fields live on DeferredSettings and are
+    # resolved on first access (see _DeferredField below)
+    jwt_secret_key = _DeferredField()
+    database_url = _DeferredField()
+    google_client_id = _DeferredField()
+    google_client_secret = _DeferredField()
+    google_redirect_uri = _DeferredField()
+    github_oauth_client_id = _DeferredField()
+    github_oauth_client_secret = _DeferredField()
+    github_oauth_redirect_uri = _DeferredField()
 
     class Config:
-        env_file = ".env"
-        case_sensitive = False
+        ignored_types = (_DeferredField,)
+
+    # Precomputed CORS allow-list (see model_post_init)
+    _cors_origins_set: frozenset = PrivateAttr(default=frozenset())
+
+    def model_post_init(self, __context) -> None:
+        """Build the CORS allow-list once, at validation time"""
+        # Browsers never send a trailing slash in the Origin header
+        self._cors_origins_set = frozenset(
+            origin.rstrip("/") for origin in self.cors_origins
+        )
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Create necessary directories
-        Path(self.chroma_persist_dir).mkdir(parents=True, exist_ok=True)
+    @property
+    def cors_origins_set(self) -> frozenset:
+        """Allowed CORS origins as a frozenset for O(1) membership checks"""
+        return self._cors_origins_set
+
+    @cached_property
+    def model_spec(self) -> ModelSpec:
+        """Quantization / context-window spec for the configured Ollama model"""
+        return get_model_spec(self.ollama_model)
+
+    @cached_property
+    def deferred(self) -> "DeferredSettings":
+        """Rarely-used secrets, loaded from the environment on first access"""
+        return get_deferred_settings()
 
     @field_validator(
         "cors_origins", "cors_allow_methods", "cors_allow_headers", mode="before"
@@ -131,94 +266,21 @@ class Settings(BaseSettings):
                 except json.JSONDecodeError:
                     pass
             # Fall back to comma-separated format (e.g., 'http://localhost:3000,http://localhost:5173')
-            return [item.strip() for item in value.split(",") if item.strip()]
+            return _split_list_value(value)
         return value
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Process-wide Settings instance (validated once)"""
+    return Settings()
+
+
+@lru_cache(maxsize=1)
+def get_deferred_settings() -> DeferredSettings:
+    """Process-wide DeferredSettings instance (validated on first use)"""
+    return DeferredSettings()
+
+
 # Global settings instance
-settings = Settings()
-
-
-# Project documentation file patterns for detection
-PROJECT_DOC_FILES = {
-    "governance": [
-        "GOVERNANCE.md",
-        "docs/GOVERNANCE.md",
-        ".github/GOVERNANCE.md",
-    ],
-    "contributing": [
-        "CONTRIBUTING.md",
-        "CONTRIBUTING.rst",
-        "docs/CONTRIBUTING.md",
-        "docs/CONTRIBUTING.rst",
-        ".github/CONTRIBUTING.md",
-        ".github/CONTRIBUTING.rst",
-    ],
-    "code_of_conduct": [
-        "CODE_OF_CONDUCT.md",
-        ".github/CODE_OF_CONDUCT.md",
-        "docs/CODE_OF_CONDUCT.md",
-    ],
-    "security": [
-        "SECURITY.md",
-        ".github/SECURITY.md",
-        "docs/SECURITY.md",
-    ],
-    "maintainers": [
-        "MAINTAINERS.md",
-        "MAINTAINERS.rst",
-        "COMMITTERS.rst",
-        "Maintainers.md",
-        "CODEOWNERS",
-        ".github/CODEOWNERS",
-        "docs/CODEOWNERS",
-        "docs/MAINTAINERS.md",
-        "docs/MAINTAINERS.rst",
-        "docs/COMMITTERS.rst",
-    ],
-    "license": [
-        "LICENSE.md",
-        "LICENSE",
-        "docs/LICENSE.md",
-        "LICENCE.md",
-        "LICENCE",
-        "docs/LICENCE"
-    ],
-    "charter": [
-        "CHARTER.md",
-        "docs/CHARTER.md",
-    ],
-    "readme": [
-        "README.md",
-        "README.rst",
-        "docs/README.md",
-        "docs/README.rst",
-    ],
-}
-
-
-# Multi-Repository Governance Configuration
-# Maps projects that have governance docs in separate repositories
-MULTI_REPO_GOVERNANCE = {
-    "tensorflow-tensorflow": {
-        "governance_repo": "tensorflow/community",
-        "description": "TensorFlow governance is maintained in separate community repo",
-        "primary_files": [
-            "governance/CHARTER.md",
-            "governance/GOVERNANCE.md",
-            "CONTRIBUTING.md",
-            "CODE_OF_CONDUCT.md",
-        ],
-    },
-    "kubernetes-kubernetes": {
-        "governance_repo": "kubernetes/community",
-        "description": "Kubernetes governance is in separate community repo",
-        "primary_files": [
-            "governance.md",
-            "committee-steering/governance/sig-governance.md",
-            "contributors/guide/README.md",
-            "code-of-conduct.md",
-            "sig-list.md",
-        ],
-    },
-}
+settings = get_settings()
@@ -0,0 +1,218 @@
+"""
+Static project constants for RepWise
+Document detection patterns and multi-repo governance mappings, kept apart
+from the Pydantic settings model so they can be imported on their own
+"""
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional, Tuple
+
+
+# Project documentation file patterns for detection
+PROJECT_DOC_FILES = {
+    "governance": [
+        "GOVERNANCE.md",
+        "docs/GOVERNANCE.md",
+        ".github/GOVERNANCE.md",
+    ],
+    "contributing": [
+        "CONTRIBUTING.md",
+        "CONTRIBUTING.rst",
+        "docs/CONTRIBUTING.md",
+        "docs/CONTRIBUTING.rst",
+        ".github/CONTRIBUTING.md",
+        ".github/CONTRIBUTING.rst",
+    ],
+    "code_of_conduct": [
+        "CODE_OF_CONDUCT.md",
+        ".github/CODE_OF_CONDUCT.md",
+        "docs/CODE_OF_CONDUCT.md",
+    ],
+    "security": [
+        "SECURITY.md",
+        ".github/SECURITY.md",
+        "docs/SECURITY.md",
+    ],
+    "maintainers": [
+        "MAINTAINERS.md",
+        "MAINTAINERS.rst",
+        "COMMITTERS.rst",
+        "Maintainers.md",
+        "CODEOWNERS",
+        ".github/CODEOWNERS",
+        "docs/CODEOWNERS",
+        "docs/MAINTAINERS.md",
+        "docs/MAINTAINERS.rst",
+        "docs/COMMITTERS.rst",
+    ],
+    "license": [
+        "LICENSE.md",
+        "LICENSE",
+        "docs/LICENSE.md",
+        "LICENCE.md",
+        "LICENCE",
+        "docs/LICENCE"
+    ],
+    "charter": [
+        "CHARTER.md",
+        "docs/CHARTER.md",
+    ],
+    "readme": [
+        "README.md",
+        "README.rst",
+        "docs/README.md",
+        "docs/README.rst",
+    ],
+}
+
+
+def _dedupe_paths(paths) -> tuple:
+    """Drop case-insensitive duplicates, keeping the first spelling in order"""
+    unique = {}
+    for path in paths:
+        unique.setdefault(path.lower(), sys.intern(path))
+    return tuple(unique.values())
+
+
+# Normalise to de-duplicated tuples ("Maintainers.md" == "MAINTAINERS.md" when matching)
+PROJECT_DOC_FILES = {
+    sys.intern(category): _dedupe_paths(paths)
+    for category, paths in PROJECT_DOC_FILES.items()
+}
+
+# Precomputed lookup tables for PROJECT_DOC_FILES (lowercased)
+PROJECT_DOC_FILES_SETS = {
+    category: frozenset(sys.intern(path.lower()) for path in paths)
+    for category, paths in PROJECT_DOC_FILES.items()
+}
+
+# Reverse index: lowercased pattern -> category (first category wins)
+PROJECT_DOC_FILE_INDEX = {}
+for _category, _paths in PROJECT_DOC_FILES.items():
+    for _path in _paths:
+        PROJECT_DOC_FILE_INDEX.setdefault(sys.intern(_path.lower()), _category)
+del _category, _paths, _path
+
+# Patterns without a directory part match on the file name alone
+PROJECT_DOC_BASENAME_INDEX = {
+    pattern: category
+    for pattern, category in PROJECT_DOC_FILE_INDEX.items()
+    if "/" not in pattern
+}
+
+# File names of directory-qualified patterns (e.g. "docs/licence" -> "licence")
+_QUALIFIED_BASENAMES = frozenset(
+    pattern.rsplit("/", 1)[1] for pattern in PROJECT_DOC_FILE_INDEX if "/" in pattern
+)
+
+# Every file name a project doc can have; a cheap prefilter for tree scans
+PROJECT_DOC_BASENAMES = frozenset(PROJECT_DOC_BASENAME_INDEX) | _QUALIFIED_BASENAMES
+
+
+def classify_doc_path(path: str) -> Optional[str]:
+    """
+    Get the PROJECT_DOC_FILES category for a repository file path.
+
+    A path matches a pattern when it equals the pattern or ends with
+    "/<pattern>" (case-insensitive). Most paths are resolved by one or two
+    dict lookups (full path, then file name); the slash-delimited suffix
+    walk only runs for file names that appear in a directory-qualified
+    pattern.
+    """
+    path_lower = path.lower()
+    category = PROJECT_DOC_FILE_INDEX.get(path_lower)
+    if category is not None:
+        return category
+
+    basename = path_lower.rpartition("/")[2]
+    category = PROJECT_DOC_BASENAME_INDEX.get(basename)
+    if category is not None:
+        return category
+    if basename not in _QUALIFIED_BASENAMES:
+        return None
+
+    slash = path_lower.find("/")
+    while slash != -1:
+        category = PROJECT_DOC_FILE_INDEX.get(path_lower[slash + 1:])
+        if category is not None:
+            return category
+        slash = path_lower.find("/", slash + 1)
+
+    return None
+
+
+@dataclass(frozen=True)
+class MultiRepoGovernance:
+    """Project whose governance docs live in a separate repository"""
+    __slots__ = ("governance_repo", "description", "primary_files")
+
+    governance_repo: str
+    description: str
+    primary_files: Tuple[str, ...]
+
+    def __post_init__(self):
+        # Accept any iterable; store an immutable tuple of interned paths
+        object.__setattr__(
+            self, "primary_files", tuple(map(sys.intern, self.primary_files))
+        )
+
+
+# Multi-Repository Governance Configuration
+# Maps projects that have governance docs in separate repositories
+MULTI_REPO_GOVERNANCE = MappingProxyType({
+    "tensorflow-tensorflow": MultiRepoGovernance(
+        governance_repo="tensorflow/community",
+        description="TensorFlow governance is maintained in separate community repo",
+        primary_files=(
+            "governance/CHARTER.md",
+            "governance/GOVERNANCE.md",
+            "CONTRIBUTING.md",
+            "CODE_OF_CONDUCT.md",
+        ),
+    ),
+    "kubernetes-kubernetes": MultiRepoGovernance(
+        governance_repo="kubernetes/community",
+        description="Kubernetes governance is in separate community repo",
+        primary_files=(
+            "governance.md",
+            "committee-steering/governance/sig-governance.md",
+            "contributors/guide/README.md",
+            "code-of-conduct.md",
+            "sig-list.md",
+        ),
+    ),
+})
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    """Ollama model variant: tag, weight quantization and context window"""
+    __slots__ = ("name", "quant", "ctx_len")
+
+    name: str
+    quant: Optional[str]
+    ctx_len: Optional[int]
+
+
+# Known Ollama model tags. Quantized variants (q4_K_M, q8_0) trade a little
+# accuracy for a large cut in memory use and latency versus fp16/bf16 weights.
+MODEL_REGISTRY = MappingProxyType({
+    spec.name: spec
+    for spec in (
+        ModelSpec("mistral:latest", quant="q4_K_M", ctx_len=8192),
+        ModelSpec("mistral:7b-instruct-q4_K_M", quant="q4_K_M", ctx_len=8192),
+        ModelSpec("mistral:7b-instruct-q8_0", quant="q8_0", ctx_len=8192),
+        ModelSpec("mistral:7b-instruct-fp16", quant="fp16", ctx_len=8192),
+        ModelSpec("llama3.2:latest", quant="q4_K_M", ctx_len=8192),
+        ModelSpec("llama3.2:3b-instruct-q8_0", quant="q8_0", ctx_len=8192),
+    )
+})
+
+
+def get_model_spec(model_name: str) -> ModelSpec:
+    """Look up a model tag, falling back to Ollama's own defaults if unknown"""
+    spec = MODEL_REGISTRY.get(model_name)
+    if spec is None:
+        spec = ModelSpec(model_name, quant=None, ctx_len=None)
+    return spec
@@ -0,0 +1,27 @@
+"""
+Shared HTTP connection pool for RepWise
+One keep-alive requests.Session reused by every outbound JSON API call
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _build_session() -> requests.Session:
+    """Create a pooled session with retries for transient gateway errors"""
+    session = requests.Session()
+    # urllib3 only retries idempotent methods by default, so single-use
+    # OAuth code exchanges (POST) are not replayed
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Accept": "application/json"})
+    return session
+
+
+# Process-wide session: one TLS handshake per upstream host
+SHARED_SESSION = _build_session()
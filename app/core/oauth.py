@@ -3,10 +3,12 @@ OAuth Integration Utilities
 Handles Google and GitHub OAuth authentication flows
 """
 import os
-import requests
 from typing import Dict, Optional
+from urllib.parse import urlencode
 from loguru import logger
 
+from app.core.http_pool import SHARED_SESSION
+
 # OAuth Configuration
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID", "")
 GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET", "")
@@ -20,6 +22,10 @@ GITHUB_REDIRECT_URI = os.getenv("GITHUB_REDIRECT_URI", "http://localhost:3000/au
 class OAuthProvider:
     """Base class for OAuth providers"""
 
+    def __init__(self):
+        """Use the process-wide pooled session for every call to this provider"""
+        self._session = SHARED_SESSION
+
     def get_authorization_url(self, state: str) -> str:
         """Get OAuth authorization URL"""
         raise NotImplementedError
@@ -60,7 +66,7 @@ class GoogleOAuth(OAuthProvider):
             "prompt": "consent"
         }
 
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
+        query_string = urlencode(params)
         return f"{self.AUTHORIZATION_URL}?{query_string}"
 
     def exchange_code_for_token(self, code: str, redirect_uri: Optional[str] = None) -> Optional[Dict]:
@@ -83,7 +89,7 @@ class GoogleOAuth(OAuthProvider):
                 "redirect_uri": redirect_uri or GOOGLE_REDIRECT_URI
             }
 
-            response = requests.post(self.TOKEN_URL, data=data)
+            response = self._session.post(self.TOKEN_URL, data=data)
             response.raise_for_status()
 
             return response.json()
@@ -103,7 +109,7 @@ class GoogleOAuth(OAuthProvider):
         """
         try:
             headers = {"Authorization": f"Bearer {access_token}"}
-            response = requests.get(self.USER_INFO_URL, headers=headers)
+            response = self._session.get(self.USER_INFO_URL, headers=headers)
             response.raise_for_status()
 
             user_data = response.json()
@@ -146,7 +152,7 @@ class GitHubOAuth(OAuthProvider):
             "state": state
         }
 
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
+        query_string = urlencode(params)
         return f"{self.AUTHORIZATION_URL}?{query_string}"
 
     def exchange_code_for_token(self, code: str, redirect_uri: Optional[str] = None) -> Optional[Dict]:
@@ -168,8 +174,7 @@ class GitHubOAuth(OAuthProvider):
                 "redirect_uri": redirect_uri or GITHUB_REDIRECT_URI
             }
 
-            headers = {"Accept": "application/json"}
-            response = requests.post(self.TOKEN_URL, data=data, headers=headers)
+            response = self._session.post(self.TOKEN_URL, data=data)
             response.raise_for_status()
 
             return response.json()
@@ -188,32 +193,29 @@ class GitHubOAuth(OAuthProvider):
             User info dictionary with keys: id, email, login, name, avatar_url
         """
         try:
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Accept": "application/json"
-            }
+            headers = {"Authorization": f"Bearer {access_token}"}
 
             # Get user profile
-            response = requests.get(self.USER_INFO_URL, headers=headers)
+            response = self._session.get(self.USER_INFO_URL, headers=headers)
             response.raise_for_status()
             user_data = response.json()
 
             # Get user emails (GitHub user endpoint doesn't always include email)
-            email_response = requests.get(self.USER_EMAIL_URL, headers=headers)
+            email_response = self._session.get(self.USER_EMAIL_URL, headers=headers)
             email_response.raise_for_status()
             emails = email_response.json()
 
             # Find primary email
-            primary_email = next(
-                (e["email"] for e in emails if e.get("primary") and e.get("verified")),
-                user_data.get("email", "")
-            )
+            primary_email = user_data.get("email", "")
+            for e in emails:
+                if e.get("primary") and e.get("verified"):
+                    primary_email = e["email"]
+                    break
 
             # Parse name
             full_name = user_data.get("name", user_data.get("login", ""))
-            name_parts = full_name.split(" ", 1)
-            first_name = name_parts[0] if name_parts else user_data.get("login", "User")
-            last_name = name_parts[1] if len(name_parts) > 1 else ""
+            first_name, _, last_name = full_name.partition(" ")
+            first_name = first_name or user_data.get("login", "User")
 
             return {
                 "id": str(user_data.get("id")),
@@ -2,19 +2,42 @@
 Enhanced Governance File Pattern Matcher
 Comprehensive pattern matching for all governance document types across any location
 """
-import os
 import re
-from typing import Optional, Tuple, List
-from dataclasses import dataclass
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True)
 class GovernancePattern:
     """Represents a governance file pattern"""
+    __slots__ = ("category", "filenames", "extensions", "locations", "expected_names")
+
     category: str
-    filenames: List[str]
-    extensions: List[str]
-    locations: List[str]
+    filenames: Tuple[str, ...]
+    extensions: Tuple[str, ...]
+    locations: Tuple[str, ...]
+
+    def __post_init__(self):
+        # Accept any iterable; store compact tuples of interned strings
+        for name in ("filenames", "extensions", "locations"):
+            object.__setattr__(self, name, tuple(map(sys.intern, getattr(self, name))))
+        # Derived (not a dataclass field): every filename + extension
+        # combination, computed once
+        expected_names = dict.fromkeys(
+            sys.intern(f"{base}{ext}") for base in self.filenames for ext in self.extensions
+        )
+        object.__setattr__(self, "expected_names", tuple(expected_names))
+
+
+@dataclass
+class _LocationNode:
+    """Trie node for one directory level of the pattern locations"""
+    # filename -> category for patterns located exactly at this directory
+    names: Dict[str, str] = field(default_factory=dict)
+    # next path segment -> child node
+    children: Dict[str, '_LocationNode'] = field(default_factory=dict)
 
 
 class GovernancePatternMatcher:
@@ -118,17 +141,89 @@ class GovernancePatternMatcher:
     }
 
     # Additional keywords for governance directories
-    GOVERNANCE_KEYWORDS = [
+    GOVERNANCE_KEYWORDS = (
         'governance', 'contributing', 'conduct', 'security',
         'maintainer', 'owner', 'committer', 'charter',
         'policy', 'guideline', 'coc'
-    ]
+    )
 
     # Governance-related directories
-    GOVERNANCE_DIRS = [
+    GOVERNANCE_DIRS = (
         '.github', 'docs', 'community', '.gitlab',
         'governance', 'policies', 'templates'
-    ]
+    )
+
+    # Issue/PR template indicators (within .github)
+    TEMPLATE_INDICATORS = (
+        'issue_template', 'pull_request_template',
+        'bug_report', 'feature_request', 'config.yml'
+    )
+
+    # Each word list compiled once into a single alternation regex: one
+    # C-level scan per check instead of a Python loop of substring tests.
+    # Plain literal alternations never backtrack, so stdlib re already runs
+    # in linear time; DFA engines (RE2/Hyperscan) only add per-call binding
+    # overhead on inputs as short as file paths
+    _TEMPLATE_RE = re.compile('|'.join(map(re.escape, TEMPLATE_INDICATORS)))
+    _GOVERNANCE_DIR_RE = re.compile('|'.join(map(re.escape, GOVERNANCE_DIRS)))
+    _GOVERNANCE_KEYWORD_RE = re.compile('|'.join(map(re.escape, GOVERNANCE_KEYWORDS)))
+
+    # Human-readable names for matches() categories
+    DISPLAY_NAMES = {
+        'governance': 'Governance',
+        'contributing': 'Contributing',
+        'code_of_conduct': 'Code of Conduct',
+        'security': 'Security',
+        'maintainers': 'Maintainers',
+        'license': 'License',
+        'charter': 'Charter',
+        'readme': 'README',
+        'support': 'Support',
+        'roadmap': 'Roadmap',
+        'changelog': 'Changelog',
+        'authors': 'Authors',
+        'funding': 'Funding',
+        'templates': 'Templates'
+    }
+
+    # Distinct paths remembered by matches()
+    MATCH_CACHE_SIZE = 16384
+
+    def __init__(self):
+        """Precompute lookup tables from PATTERNS"""
+        self._location_trie = self._build_location_trie()
+        # Every filename an exact pattern can have, at any location
+        self._exact_filenames = frozenset(self._iter_trie_names(self._location_trie))
+        # Constant for the lifetime of the matcher; see get_all_possible_paths()
+        self._all_possible_paths = self._build_all_possible_paths()
+        # matches() is pure; repeated paths (re-scans, filter + categorize)
+        # become a single thread-safe cache probe
+        self._match_cached = lru_cache(maxsize=self.MATCH_CACHE_SIZE)(self._match)
+
+    @classmethod
+    def _build_location_trie(cls) -> _LocationNode:
+        """
+        Index every filename in PATTERNS under its location's path segments
+
+        The root node holds the root-level ('' location) filenames.
+        """
+        root = _LocationNode()
+        for category, pattern in cls.PATTERNS.items():
+            for location in pattern.locations:
+                node = root
+                for segment in location.rstrip('/').split('/') if location else ():
+                    node = node.children.setdefault(segment, _LocationNode())
+                for filename in pattern.expected_names:
+                    # First category wins, as in PATTERNS order
+                    node.names.setdefault(filename, category)
+        return root
+
+    @classmethod
+    def _iter_trie_names(cls, node: _LocationNode):
+        """Yield the filenames stored in a location trie node and below it"""
+        yield from node.names
+        for child in node.children.values():
+            yield from cls._iter_trie_names(child)
 
     def matches(self, filepath: str) -> Tuple[bool, Optional[str]]:
         """
@@ -140,14 +235,35 @@ class GovernancePatternMatcher:
         Returns:
             (is_governance_file, category)
         """
+        return self._match_cached(filepath)
+
+    def matches_batch(self, filepaths: Iterable[str]) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Check many paths at once, e.g. a full Git tree listing
+
+        Paths in a tree listing are distinct, so the batch bypasses the
+        matches() LRU cache: caching them would only evict the results of
+        repeated individual lookups.
+
+        Args:
+            filepaths: Relative paths from repo root
+
+        Returns:
+            (is_governance_file, category) for each path, in input order
+        """
+        match = self._match
+        return [match(path) for path in filepaths]
+
+    def _match(self, filepath: str) -> Tuple[bool, Optional[str]]:
+        """Uncached implementation of matches()"""
         path_lower = filepath.lower()
-        filename = os.path.basename(path_lower)
-        dirname = os.path.dirname(path_lower)
+        # One scan for the last '/', instead of os.path.basename + dirname
+        filename = path_lower.rpartition('/')[2]
 
         # Method 1: Exact pattern matching
-        for category, pattern in self.PATTERNS.items():
-            if self._matches_pattern(filename, dirname, pattern):
-                return True, category
+        category = self._match_exact(path_lower, filename)
+        if category:
+            return True, category
 
         # Method 2: Template files in .github
         if self._is_template_file(path_lower):
@@ -159,79 +275,76 @@ class GovernancePatternMatcher:
 
         return False, None
 
-    def _matches_pattern(
-        self,
-        filename: str,
-        dirname: str,
-        pattern: GovernancePattern
-    ) -> bool:
-        """Check if file matches a specific pattern"""
-        # Check all combinations of base name + extension
-        for base in pattern.filenames:
-            for ext in pattern.extensions:
-                expected = f"{base}{ext}"
-
-                # Check in all possible locations
-                for location in pattern.locations:
-                    # Root location
-                    if not location and dirname == '' and filename == expected:
-                        return True
-
-                    # Specific directory
-                    if location:
-                        # Remove trailing slash for comparison
-                        loc = location.rstrip('/')
-                        if dirname == loc and filename == expected:
-                            return True
-                        # Also check subdirectories (e.g., docs/governance/)
-                        if dirname.startswith(loc + '/') and filename == expected:
-                            return True
+    def _match_exact(self, path: str, filename: str) -> Optional[str]:
+        """
+        Look up a file in the location trie
 
-        return False
+        Root files only match root patterns. Files in subdirectories match a
+        location equal to their directory or to one of its parent directories
+        (e.g. docs/governance/), so the directories of the path are walked
+        down from the root one segment at a time, stopping at the first
+        unknown segment.
+        """
+        # Most files (sources, assets) fail this single set lookup
+        if filename not in self._exact_filenames:
+            return None
+
+        node = self._location_trie
+        if '/' not in path:
+            return node.names.get(filename)
+
+        segment, _, rest = path.partition('/')
+        while True:
+            node = node.children.get(segment)
+            if node is None:
+                return None
+            category = node.names.get(filename)
+            if category:
+                return category
+            if '/' not in rest:
+                # Only the filename is left
+                return None
+            segment, _, rest = rest.partition('/')
 
     def _is_template_file(self, path: str) -> bool:
         """Check if file is a template (issue/PR templates, etc.)"""
         if '.github' not in path:
             return False
 
-        template_indicators = [
-            'issue_template', 'pull_request_template',
-            'bug_report', 'feature_request', 'config.yml'
-        ]
-
-        return any(indicator in path for indicator in template_indicators)
+        return self._TEMPLATE_RE.search(path) is not None
 
     def _is_governance_dir_file(self, path: str, filename: str) -> bool:
         """Check if file is in a governance directory with relevant keywords"""
         # Check if in a governance directory
-        in_gov_dir = any(gov_dir in path for gov_dir in self.GOVERNANCE_DIRS)
-
-        if not in_gov_dir:
+        if self._GOVERNANCE_DIR_RE.search(path) is None:
             return False
 
         # Check if filename contains governance keywords
-        return any(keyword in filename for keyword in self.GOVERNANCE_KEYWORDS)
+        return self._GOVERNANCE_KEYWORD_RE.search(filename) is not None
 
-    def get_all_possible_paths(self) -> List[str]:
+    def get_all_possible_paths(self) -> Tuple[str, ...]:
         """
-        Generate all possible governance file paths
+        Get all possible governance file paths
         Used for targeted Contents API queries
 
         Returns:
-            List of paths to check
+            Sorted tuple of paths to check (precomputed and shared, so it
+            is immutable)
         """
-        paths = []
+        return self._all_possible_paths
 
-        for pattern in self.PATTERNS.values():
-            for base in pattern.filenames:
-                for ext in pattern.extensions:
-                    filename = f"{base}{ext}"
+    @classmethod
+    def _build_all_possible_paths(cls) -> Tuple[str, ...]:
+        """Generate, de-duplicate and sort every governance file path"""
+        paths = []
 
-                    for location in pattern.locations:
-                        if location:
-                            paths.append(f"{location}{filename}")
-                        else:
-                            paths.append(filename)
+        for pattern in cls.PATTERNS.values():
+            for filename in pattern.expected_names:
+                for location in pattern.locations:
+                    if location:
+                        paths.append(f"{location}{filename}")
+                    else:
+                        paths.append(filename)
 
         # Add common template paths
         template_paths = [
@@ -244,7 +357,7 @@ class GovernancePatternMatcher:
         paths.extend(template_paths)
 
         # Remove duplicates and sort
-        return sorted(set(paths))
+        return tuple(sorted({sys.intern(path) for path in paths}))
 
     def categorize_file(self, filepath: str) -> Optional[str]:
         """
@@ -261,23 +374,7 @@ class GovernancePatternMatcher:
 
     def get_file_type_display_name(self, category: str) -> str:
         """Get human-readable display name for category"""
-        display_names = {
-            'governance': 'Governance',
-            'contributing': 'Contributing',
-            'code_of_conduct': 'Code of Conduct',
-            'security': 'Security',
-            'maintainers': 'Maintainers',
-            'license': 'License',
-            'charter': 'Charter',
-            'readme': 'README',
-            'support': 'Support',
-            'roadmap': 'Roadmap',
-            'changelog': 'Changelog',
-            'authors': 'Authors',
-            'funding': 'Funding',
-            'templates': 'Templates'
-        }
-        return display_names.get(category, category.title())
+        return self.DISPLAY_NAMES.get(category, category.title())
 
 
 # Global instance for easy access
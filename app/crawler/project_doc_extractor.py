@@ -3,17 +3,75 @@ Advanced Project Document Extractor
 Extracts project documentation (README, LICENSE, CONTRIBUTING, CODE_OF_CONDUCT, SECURITY, etc.)
 Implements multi-method extraction with rate limiting
 """
+import base64
 import re
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import unquote
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from loguru import logger
 
+import httpx
 from github import Github, GithubException, RateLimitExceededException
+from github.ContentFile import ContentFile
 from github.Repository import Repository
 from github.GithubObject import NotSet
 
-from app.core.config import settings, PROJECT_DOC_FILES
+from app.core.config import settings
+from app.core.constants import (
+    PROJECT_DOC_BASENAMES,
+    PROJECT_DOC_FILES,
+    classify_doc_path,
+)
+
+
+@lru_cache(maxsize=8192)
+def _match_project_doc_file(file_path: str) -> Optional[Tuple[str, str]]:
+    """
+    Match file path against project document file patterns
+    Returns (file_type, detected_path) or None
+
+    Memoized process-wide: the same paths (README.md, LICENSE, ...) recur
+    across strategies and across repositories.
+    """
+    file_type = classify_doc_path(file_path)
+    if file_type is None:
+        return None
+    return (file_type, file_path)
+
+
+def _doc_path_rank(path: str) -> Tuple[int, int]:
+    """
+    Sort key for candidate paths of one document type (lower wins)
+
+    Shallower files win first (a root LICENSE.md beats x/LICENSE), then
+    shorter paths at the same depth.
+    """
+    return path.count("/"), len(path)
+
+
+def _retry_after_seconds(value: str) -> Optional[float]:
+    """
+    Delay advised by a Retry-After header, in seconds
+
+    The header is either a number of seconds or an HTTP date (RFC 9110).
+    Returns None when it is neither.
+    """
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
 
 
 class ProjectDocExtractor:
@@ -25,36 +83,100 @@ class ProjectDocExtractor:
     - Extracts: README, LICENSE, CONTRIBUTING, CODE_OF_CONDUCT, SECURITY, GOVERNANCE, MAINTAINERS, etc.
     """
 
+    # Community Profile API "files" keys -> PROJECT_DOC_FILES type
+    COMMUNITY_PROFILE_FILES = {
+        "readme": "readme",
+        "license": "license",
+        "contributing": "contributing",
+        "code_of_conduct_file": "code_of_conduct",
+    }
+
+    # Concurrent Contents API probes per repository
+    PROBE_WORKERS = 8
+    # Concurrent blob content fetches per repository
+    FETCH_WORKERS = 6
+    # Concurrent repositories in extract_multiple_repos(parallel=True)
+    REPO_WORKERS = 5
+    # Maximum number of decoded blobs kept in the content-addressed cache
+    BLOB_CACHE_SIZE = 1024
+    # Retries of a blob fetch rejected by GitHub's secondary rate limit
+    BLOB_RETRIES = 2
+
     def __init__(self, github_token: str = None):
         """Initialize extractor with GitHub authentication"""
         token = github_token or settings.github_token
-        self.github = Github(token, per_page=100)
+        # Without a token every call would fail or hit the anonymous rate
+        # limit, so extraction short-circuits instead of calling the API
+        self._enabled = bool(token)
+        # Size the connection pool for the concurrent probe/fetch workers so
+        # threads reuse keep-alive connections instead of opening new ones
+        self.github = Github(
+            token,
+            per_page=100,
+            pool_size=max(self.PROBE_WORKERS, self.FETCH_WORKERS) * self.REPO_WORKERS,
+        )
+
+        # Direct client for the parallel Git Blobs fetches (and the raw tree
+        # and community profile JSON): over HTTP/2 the concurrent requests
+        # share one multiplexed TLS connection
+        self._http = self._create_http_client(token)
+        # (remaining, reset timestamp) from the latest httpx response;
+        # PyGithub's rate_limiting does not see these requests
+        self._http_rate_limit: Optional[Tuple[int, int]] = None
+
+        # Decoded file contents keyed by git blob SHA. A blob SHA identifies
+        # its content exactly, so entries never go stale: re-extracting a
+        # repo only downloads documents whose SHA changed
+        self._blob_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._blob_cache_lock = threading.Lock()
 
         logger.info("ProjectDocExtractor initialized")
 
-    def _check_rate_limit(self):
-        """Check and handle GitHub API rate limits"""
+    def _create_http_client(self, token: str) -> httpx.Client:
+        """Create the GitHub API client, preferring HTTP/2 when h2 is installed"""
+        options = dict(
+            base_url="https://api.github.com",
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github+json",
+            },
+            timeout=15.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
         try:
-            rate_limit = self.github.get_rate_limit()
+            return httpx.Client(http2=True, **options)
+        except ImportError:
+            logger.warning("h2 not installed - GitHub blob fetches use HTTP/1.1")
+            return httpx.Client(**options)
 
-            # Handle different PyGithub versions and rate limit structures
-            if hasattr(rate_limit, 'core'):
-                core_limit = rate_limit.core
-            elif hasattr(rate_limit, 'rate'):
-                core_limit = rate_limit.rate
-            else:
-                # If structure is unknown, log and skip rate limit check
-                logger.warning("Unable to determine rate limit structure, skipping check")
-                return
+    def close(self):
+        """Close the pooled GitHub API connections"""
+        self._http.close()
+
+    def _check_rate_limit(self):
+        """
+        Check and handle GitHub API rate limits
+
+        Reads the X-RateLimit-* headers PyGithub records from the most recent
+        API response, so this only costs a request (get_rate_limit) before
+        the first response has been seen, not on every check.
+        """
+        try:
+            remaining, limit_total = self.github.rate_limiting
+            reset_timestamp = None
 
-            remaining = core_limit.remaining
-            limit_total = core_limit.limit
+            # Blob fetches share the same quota; use their snapshot when it
+            # is lower and still within its reset window
+            http_limit = self._http_rate_limit
+            if http_limit is not None and http_limit[0] < remaining and http_limit[1] > time.time():
+                remaining, reset_timestamp = http_limit
 
             logger.debug(f"GitHub API rate limit: {remaining} / {limit_total}")
 
             if remaining < settings.github_rate_limit_threshold:
-                reset_time = core_limit.reset
-                sleep_duration = (reset_time - datetime.now()).total_seconds() + 10
+                if reset_timestamp is None:
+                    reset_timestamp = self.github.rate_limiting_resettime
+                sleep_duration = reset_timestamp - time.time() + 10
 
                 if sleep_duration > 0:
                     logger.warning(
@@ -64,33 +186,68 @@ class ProjectDocExtractor:
         except Exception as e:
             logger.warning(f"Error checking rate limit: {e}. Continuing without rate limit check.")
 
-    def _match_project_doc_file(self, file_path: str) -> Optional[Tuple[str, str]]:
+    def _probe_path(self, repo: Repository, path: str) -> Tuple[str, Optional[ContentFile]]:
+        """Fetch a single path via the Contents API; (path, None) if absent or a directory"""
+        try:
+            content_file = repo.get_contents(path)
+        except Exception:
+            # File doesn't exist at this path
+            return path, None
+
+        if not content_file or isinstance(content_file, list):
+            return path, None
+        return path, content_file
+
+    def _call_community_profile(self, repo: Repository) -> Dict[str, Dict]:
         """
-        Match file path against project document file patterns
-        Returns (file_type, detected_path) or None
+        Locate documents with one call to the Community Profile API
+
+        GET /repos/{owner}/{repo}/community/profile reports the README,
+        LICENSE, CONTRIBUTING and CODE_OF_CONDUCT files GitHub detected,
+        with their html_url (from which the repository path is recovered).
         """
-        file_path_lower = file_path.lower()
+        files_found = {}
 
-        for file_type, patterns in PROJECT_DOC_FILES.items():
-            for pattern in patterns:
-                pattern_lower = pattern.lower()
-                # Check exact match or ends with pattern
-                if file_path_lower == pattern_lower or file_path_lower.endswith(
-                    f"/{pattern_lower}"
-                ):
-                    return (file_type, file_path)
+        # PyGithub has no wrapper for this endpoint
+        profile = self._get_json(f"/repos/{repo.full_name}/community/profile")
+        profile_files = (profile or {}).get("files") or {}
+        blob_prefix = f"/blob/{repo.default_branch}/"
+
+        for profile_key, file_type in self.COMMUNITY_PROFILE_FILES.items():
+            entry = profile_files.get(profile_key)
+            html_url = entry.get("html_url") if entry else None
+            if not html_url or blob_prefix not in html_url:
+                continue
+
+            path = unquote(html_url.split(blob_prefix, 1)[1])
+            # Only accept files our own patterns recognise for this type
+            if classify_doc_path(path) != file_type:
+                continue
+
+            files_found[file_type] = {
+                "path": path,
+                "sha": None,  # not reported; content is fetched by path
+                "size": 0,
+                "url": html_url,
+                "source": "community_profile",
+            }
 
-        return None
+        return files_found
 
     def _extract_via_community_profile(
-        self, repo: Repository
+        self, repo: Repository, only_types: Optional[Set[str]] = None
     ) -> Dict[str, Dict]:
-        """Extract using GitHub Contents API for common locations"""
+        """
+        Extract using the Community Profile API, then the Contents API for
+        common locations of document types the profile does not cover
+
+        Args:
+            repo: Repository to probe
+            only_types: If given, only probe paths for these document types
+        """
         files_found = {}
 
         try:
-            self._check_rate_limit()
-
             # Check common locations for project documentation files
             common_paths = [
                 "CODE_OF_CONDUCT.md",
@@ -112,28 +269,56 @@ class ProjectDocExtractor:
                 "docs/CODEOWNERS",
             ]
 
-            for path in common_paths:
+            wanted_types = (
+                set(PROJECT_DOC_FILES) if only_types is None else set(only_types)
+            )
+            if not wanted_types:
+                return files_found
+
+            self._check_rate_limit()
+
+            # One request covers README / LICENSE / CONTRIBUTING / CODE_OF_CONDUCT
+            if wanted_types & set(self.COMMUNITY_PROFILE_FILES.values()):
                 try:
-                    # Try to get the file
-                    content_file = repo.get_contents(path)
-                    if content_file and not isinstance(content_file, list):
-                        match = self._match_project_doc_file(path)
-                        if match:
-                            file_type, _ = match
-                            if file_type not in files_found:
-                                files_found[file_type] = {
-                                    "path": path,
-                                    "sha": content_file.sha,
-                                    "size": content_file.size,
-                                    "url": content_file.html_url,
-                                    "source": "contents_api",
-                                }
-                except:
-                    # File doesn't exist at this path, continue
-                    pass
+                    for file_type, info in self._call_community_profile(repo).items():
+                        if file_type in wanted_types:
+                            files_found[file_type] = info
+                except Exception as e:
+                    logger.warning(f"Community Profile API failed: {e}")
+
+            # Probe the remaining document types path by path
+            common_paths = [
+                path for path in common_paths
+                if classify_doc_path(path) in wanted_types - files_found.keys()
+            ]
+            if not common_paths:
+                return files_found
+
+            # Probe all locations concurrently (independent read-only GETs);
+            # results come back in common_paths order so earlier paths still
+            # take precedence for each file type
+            with ThreadPoolExecutor(max_workers=self.PROBE_WORKERS) as executor:
+                probes = list(
+                    executor.map(lambda path: self._probe_path(repo, path), common_paths)
+                )
+
+            for path, content_file in probes:
+                if content_file is None:
+                    continue
+                match = _match_project_doc_file(path)
+                if match:
+                    file_type, _ = match
+                    if file_type not in files_found:
+                        files_found[file_type] = {
+                            "path": path,
+                            "sha": content_file.sha,
+                            "size": content_file.size,
+                            "url": content_file.html_url,
+                            "source": "contents_api",
+                        }
 
             logger.info(
-                f"Contents API found {len(files_found)} files for {repo.full_name}"
+                f"Community Profile / Contents API found {len(files_found)} files for {repo.full_name}"
             )
 
         except Exception as e:
@@ -141,9 +326,16 @@ class ProjectDocExtractor:
 
         return files_found
 
-    def _extract_via_tree_api(self, repo: Repository) -> Dict[str, Dict]:
-        """Extract using Git Trees API (most efficient for bulk operations)"""
+    def _extract_via_tree_api(self, repo: Repository) -> Tuple[Dict[str, Dict], bool]:
+        """
+        Extract using Git Trees API (most efficient for bulk operations)
+
+        Returns:
+            (files_found, complete) where complete is True when the full,
+            untruncated tree was scanned, i.e. absent types really are absent
+        """
         files_found = {}
+        complete = False
 
         try:
             self._check_rate_limit()
@@ -151,49 +343,137 @@ class ProjectDocExtractor:
             # Get the default branch tree
             default_branch = repo.default_branch
             branch = repo.get_branch(default_branch)
-            tree = repo.get_git_tree(branch.commit.sha, recursive=True)
+            # Raw JSON: iterate plain dicts instead of building a
+            # GitTreeElement wrapper for every entry of a large tree
+            tree = self._get_json(
+                f"/repos/{repo.full_name}/git/trees/{branch.commit.sha}",
+                params={"recursive": "1"},
+            )
+            elements = tree.get("tree", [])
 
             # Count total files
-            total_files = len(tree.tree) if hasattr(tree, 'tree') else 0
             logger.info(
-                f"Tree API fetched {total_files} items for {repo.full_name}"
+                f"Tree API fetched {len(elements)} items for {repo.full_name}"
             )
 
             # Scan all files in tree
-            for element in tree.tree:
-                if element.type == "blob":  # Files only, not directories
-                    match = self._match_project_doc_file(element.path)
+            for element in elements:
+                if element["type"] == "blob":  # Files only, not directories
+                    # Skip files whose name can't be a project doc
+                    basename = element["path"].rpartition("/")[2].lower()
+                    if basename not in PROJECT_DOC_BASENAMES:
+                        continue
+                    match = _match_project_doc_file(element["path"])
                     if match:
                         file_type, path = match
                         # Prioritize root-level files over subdirectory files
-                        if file_type not in files_found:
+                        existing = files_found.get(file_type)
+                        if existing is None or _doc_path_rank(path) < _doc_path_rank(existing["path"]):
                             files_found[file_type] = {
                                 "path": path,
-                                "sha": element.sha,
-                                "size": element.size if hasattr(element, 'size') else 0,
-                                "url": element.url,
+                                "sha": element["sha"],
+                                "size": element.get("size", 0),
+                                "url": element["url"],
                                 "source": "tree_api",
                             }
-                        else:
-                            # If we found one already, prefer shorter path (root files)
-                            existing_path = files_found[file_type]["path"]
-                            if len(path) < len(existing_path):  # Shorter path = closer to root
-                                files_found[file_type] = {
-                                    "path": path,
-                                    "sha": element.sha,
-                                    "size": element.size if hasattr(element, 'size') else 0,
-                                    "url": element.url,
-                                    "source": "tree_api",
-                                }
 
             logger.info(
                 f"Tree API matched {len(files_found)} project doc files for {repo.full_name}"
             )
+            complete = not tree.get("truncated", False)
 
         except Exception as e:
             logger.error(f"Tree API extraction failed: {e}")
 
-        return files_found
+        return files_found, complete
+
+    def _fetch_blob_content(
+        self, repo: Repository, sha: str, file_path: str
+    ) -> Optional[str]:
+        """Fetch file content by blob SHA via the Git Blobs API (cached by SHA)"""
+        with self._blob_cache_lock:
+            content = self._blob_cache.get(sha)
+            if content is not None:
+                self._blob_cache.move_to_end(sha)
+                logger.debug(f"Blob cache hit: {file_path} ({sha})")
+                return content
+
+        try:
+            response = self._get_with_retry(f"/repos/{repo.full_name}/git/blobs/{sha}")
+            response.raise_for_status()
+            blob = response.json()
+            if blob["encoding"] == "base64":
+                content = base64.b64decode(blob["content"]).decode("utf-8")
+            else:
+                content = blob["content"]
+
+            with self._blob_cache_lock:
+                self._blob_cache[sha] = content
+                while len(self._blob_cache) > self.BLOB_CACHE_SIZE:
+                    self._blob_cache.popitem(last=False)
+            return content
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                logger.debug(f"Blob not found: {file_path} ({sha})")
+            else:
+                logger.error(f"Error fetching blob for {file_path}: {e}")
+            return None
+
+        except Exception as e:
+            logger.error(f"Unexpected error fetching blob for {file_path}: {e}")
+            return None
+
+    def _get_json(self, url: str, params: Optional[Dict] = None) -> Dict:
+        """GET a GitHub REST endpoint through the httpx client and decode the JSON body"""
+        response = self._get_with_retry(url, params)
+        response.raise_for_status()
+        return response.json()
+
+    def _get_with_retry(self, url: str, params: Optional[Dict] = None) -> httpx.Response:
+        """
+        GET through the httpx client (blobs, trees, community profile),
+        recording the rate-limit headers
+
+        Requests rejected by the secondary rate limit (403/429 with a
+        Retry-After header) are retried after the advised delay, capped at
+        rate_limit_backoff_seconds. An unparseable Retry-After is returned
+        as is.
+        """
+        for attempt in range(self.BLOB_RETRIES + 1):
+            response = self._http.get(url, params=params)
+
+            remaining = response.headers.get("x-ratelimit-remaining")
+            reset = response.headers.get("x-ratelimit-reset")
+            if remaining is not None and reset is not None:
+                self._http_rate_limit = (int(remaining), int(reset))
+
+            retry_after = response.headers.get("retry-after")
+            if (
+                response.status_code not in (403, 429)
+                or retry_after is None
+                or attempt == self.BLOB_RETRIES
+            ):
+                return response
+
+            delay = _retry_after_seconds(retry_after)
+            if delay is None:
+                return response
+            delay = min(delay, settings.rate_limit_backoff_seconds)
+
+            logger.warning(f"Secondary rate limit hit; retrying in {delay:.0f}s")
+            time.sleep(delay)
+
+        return response
+
+    def _fetch_document(
+        self, repo: Repository, file_type: str, file_info: Dict
+    ) -> Optional[str]:
+        """Fetch content for a matched document, by blob SHA when available"""
+        logger.info(f"Fetching content for {file_type}: {file_info['path']}")
+        if file_info.get("sha"):
+            return self._fetch_blob_content(repo, file_info["sha"], file_info["path"])
+        return self._fetch_file_content(repo, file_info["path"])
 
     def _fetch_file_content(
         self, repo: Repository, file_path: str
@@ -248,36 +528,82 @@ class ProjectDocExtractor:
             }
         """
         start_time = time.time()
+        # One timestamp for the whole extraction (extracted_at and every
+        # file's fetched_at) instead of a datetime.now() call per file
+        now_iso = datetime.now().isoformat()
 
         logger.info(f"Starting extraction for {owner}/{repo_name}")
 
+        if not self._enabled:
+            logger.warning(f"No GitHub token configured - skipping {owner}/{repo_name}")
+            return {
+                "owner": owner,
+                "repo": repo_name,
+                "error": "no_github_token",
+                "extracted_at": now_iso,
+                "files": {},
+                "metadata": {"total_files": 0},
+            }
+
         try:
             # Get repository
             self._check_rate_limit()
             repo = self.github.get_repo(f"{owner}/{repo_name}")
 
-            # Strategy 1: Community Profile API (fast, limited coverage)
-            files_from_profile = self._extract_via_community_profile(repo)
+            # Strategy 1: Tree API (comprehensive, single request). Prefers
+            # the shallowest path per type, so root-level files win over
+            # e.g. INSTALL/README.md
+            files_from_tree, tree_complete = self._extract_via_tree_api(repo)
+
+            # Strategy 2: Community Profile / Contents API probes. A complete
+            # tree already lists every file, so only probe when the tree call
+            # failed or was truncated, for the types it did not return at
+            # the repository root
+            missing_types = (
+                set()
+                if tree_complete
+                else {
+                    file_type for file_type in PROJECT_DOC_FILES
+                    if file_type not in files_from_tree
+                    or "/" in files_from_tree[file_type]["path"]
+                }
+            )
+            files_from_profile = (
+                self._extract_via_community_profile(repo, only_types=missing_types)
+                if missing_types
+                else {}
+            )
 
-            # Strategy 2: Tree API (comprehensive, single request)
-            files_from_tree = self._extract_via_tree_api(repo)
+            # Merge, keeping the shallowest file per type from either source
+            all_files = dict(files_from_tree)
+            for file_type, info in files_from_profile.items():
+                existing = all_files.get(file_type)
+                if existing is None or _doc_path_rank(info["path"]) < _doc_path_rank(existing["path"]):
+                    all_files[file_type] = info
 
-            # Merge results (PRIORITIZE root-level files from Contents API over subdirectories)
-            # This ensures we get README.md from root, not INSTALL/README.md
-            all_files = {**files_from_tree, **files_from_profile}  # Profile overrides Tree
+            # Fetch actual content for each file in parallel via the Git Blobs
+            # API (we already have every blob SHA; no path resolution needed)
+            self._check_rate_limit()
+            file_types = list(all_files)
+            with ThreadPoolExecutor(max_workers=self.FETCH_WORKERS) as executor:
+                contents = list(
+                    executor.map(
+                        lambda file_type: self._fetch_document(
+                            repo, file_type, all_files[file_type]
+                        ),
+                        file_types,
+                    )
+                )
 
-            # Fetch actual content for each file
             project_docs_data = {}
-            for file_type, file_info in all_files.items():
-                logger.info(f"Fetching content for {file_type}: {file_info['path']}")
-                content = self._fetch_file_content(repo, file_info["path"])
-
+            for file_type, content in zip(file_types, contents):
+                file_info = all_files[file_type]
                 if content:
                     project_docs_data[file_type] = {
                         **file_info,
                         "content": content,
                         "content_length": len(content),
-                        "fetched_at": datetime.now().isoformat(),
+                        "fetched_at": now_iso,
                     }
 
             extraction_time = time.time() - start_time
@@ -287,7 +613,7 @@ class ProjectDocExtractor:
                 "owner": owner,
                 "repo": repo_name,
                 "full_name": repo.full_name,
-                "extracted_at": datetime.now().isoformat(),
+                "extracted_at": now_iso,
                 "files": project_docs_data,
                 "metadata": {
                     "total_files": len(project_docs_data),
@@ -324,7 +650,7 @@ class ProjectDocExtractor:
                 "owner": owner,
                 "repo": repo_name,
                 "error": str(e),
-                "extracted_at": datetime.now().isoformat(),
+                "extracted_at": now_iso,
                 "files": {},
                 "metadata": {"total_files": 0},
             }
@@ -335,7 +661,7 @@ class ProjectDocExtractor:
                 "owner": owner,
                 "repo": repo_name,
                 "error": str(e),
-                "extracted_at": datetime.now().isoformat(),
+                "extracted_at": now_iso,
                 "files": {},
                 "metadata": {"total_files": 0},
             }
@@ -350,29 +676,33 @@ class ProjectDocExtractor:
 
         Args:
             repos: List of (owner, repo_name) tuples
-            parallel: Whether to use parallel processing (not implemented yet for safety)
+            parallel: Extract up to REPO_WORKERS repositories concurrently
 
         Returns:
-            List of extraction results
+            List of extraction results, in the same order as repos
         """
-        results = []
-
-        for owner, repo_name in repos:
-            try:
-                result = self.extract_project_documents(owner, repo_name)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to extract {owner}/{repo_name}: {e}")
-                results.append(
-                    {
-                        "owner": owner,
-                        "repo": repo_name,
-                        "error": str(e),
-                        "files": {},
-                    }
+        if parallel and len(repos) > 1:
+            with ThreadPoolExecutor(max_workers=self.REPO_WORKERS) as executor:
+                return list(
+                    executor.map(
+                        lambda repo: self._extract_repo_safe(*repo), repos
+                    )
                 )
 
-        return results
+        return [self._extract_repo_safe(owner, repo_name) for owner, repo_name in repos]
+
+    def _extract_repo_safe(self, owner: str, repo_name: str) -> Dict:
+        """extract_project_documents that turns unexpected failures into an error result"""
+        try:
+            return self.extract_project_documents(owner, repo_name)
+        except Exception as e:
+            logger.error(f"Failed to extract {owner}/{repo_name}: {e}")
+            return {
+                "owner": owner,
+                "repo": repo_name,
+                "error": str(e),
+                "files": {},
+            }
 
     def get_extraction_summary(self, extraction_result: Dict) -> Dict:
         """Generate summary statistics from extraction result"""
@@ -2,16 +2,193 @@
 CSV Data Engine for Commits and Issues
 Handles structured queries on CSV data with LLM-powered query generation
 """
-from typing import Dict, List, Optional, Tuple
+import ast
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import CodeType
+from typing import Any, Dict, List, Optional, Tuple
+import os
+import tempfile
+import threading
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from loguru import logger
 import json
 import re
 from datetime import datetime
+from functools import lru_cache
 from app.core.config import settings
 
 
+# Column reference included in the pandas code generation prompt
+COMMITS_SCHEMA_HINT = """
+COMMITS DATA SCHEMA - ALL COLUMNS (use these EXACT column names):
+| Column          | Type    | Description                                           |
+|-----------------|---------|-------------------------------------------------------|
+| commit_sha      | string  | Unique commit identifier (use for deduplication)      |
+| name            | string  | Contributor name - USE THIS for "who" questions       |
+| email           | string  | Contributor email address                             |
+| date            | datetime| Commit timestamp (already parsed as datetime)         |
+| timestamp       | int     | Unix timestamp of commit                              |
+| filename        | string  | File path modified - USE THIS, NOT 'filepath'         |
+| change_type     | string  | 'A' (added), 'M' (modified), 'D' (deleted)           |
+| lines_added     | int     | Number of lines added in this file                    |
+| lines_deleted   | int     | Number of lines deleted in this file                  |
+| commit_message  | string  | Full commit message text                              |
+| commit_url      | string  | GitHub URL to the commit                              |
+| project         | string  | Project name                                          |
+
+CRITICAL RULES FOR COMMITS:
+1. ONE ROW PER FILE MODIFIED, not one row per commit
+2. To count COMMITS: df.drop_duplicates(subset=['commit_sha'])
+3. To count FILE MODIFICATIONS: use df directly (no dedup)
+4. Use 'name' for contributor names, NOT 'user_login'
+5. Use 'filename' for file paths, NOT 'filepath'
+6. Use 'commit_message' for message text, NOT 'message'"""
+
+ISSUES_SCHEMA_HINT = """
+ISSUES DATA SCHEMA - ALL COLUMNS (use these EXACT column names):
+| Column          | Type    | Description                                           |
+|-----------------|---------|-------------------------------------------------------|
+| type            | string  | 'issue' or 'comment' - FILTER BY THIS                 |
+| issue_num       | int     | Issue number (e.g., 123 for issue #123)              |
+| title           | string  | Issue title (only for type='issue')                   |
+| user_login      | string  | GitHub username - USE THIS for "who" questions        |
+| user_name       | string  | Display name of user                                  |
+| user_email      | string  | Email of user                                         |
+| user_id         | int     | GitHub user ID                                        |
+| issue_state     | string  | 'open' or 'closed' (lowercase)                        |
+| created_at      | datetime| When issue/comment was created                        |
+| updated_at      | datetime| When issue/comment was last updated                   |
+| body            | string  | Issue/comment content text                            |
+| reactions       | string  | JSON string with reaction counts                      |
+| issue_url       | string  | API URL to the issue                                  |
+| comment_url     | string  | API URL to the comment (if type='comment')           |
+| repo_name       | string  | Repository name                                       |
+
+CRITICAL RULES FOR ISSUES:
+1. Dataset has BOTH issues AND comments (check 'type' column)
+2. To count ISSUES: df[df['type'] == 'issue']
+3. To count ISSUE REPORTERS: df[df['type'] == 'issue'].groupby('user_login')
+4. Use 'user_login' for reporter names, NOT 'name'
+5. issue_state is lowercase ('open'/'closed'); never compare with 'OPEN'/'CLOSED'
+6. Comments have issue_state=NaN, so filtering by state excludes comments"""
+
+
+@lru_cache(maxsize=256)
+def _code_prompt_body(data_type: str, limit: int, columns: Tuple[str, ...],
+                      row_count: int) -> str:
+    """
+    Query-independent part of the pandas code generation prompt
+
+    Schema hint, rules and examples for a data type; the caller wraps it
+    with the query itself.
+    """
+    # Add data-type-specific column hints with COMPLETE schema
+    schema_hint = COMMITS_SCHEMA_HINT if data_type == "commits" else ISSUES_SCHEMA_HINT
+
+    return f"""{schema_hint}
+
+═══════════════════════════════════════════════════════════════════════════════
+                         MANDATORY RULES - READ FIRST
+═══════════════════════════════════════════════════════════════════════════════
+
+FOR COMMITS DATA - THESE 3 RULES ARE NON-NEGOTIABLE:
+1. ALWAYS use drop_duplicates(subset=['commit_sha']) when counting commits
+2. ALWAYS use 'name' column for contributor names (NEVER 'user_login')
+3. ALWAYS use 'filename' column for file paths (NEVER 'filepath')
+
+FOR ISSUES DATA:
+1. ALWAYS filter df[df['type'] == 'issue'] when counting issues or reporters
+2. ALWAYS use 'user_login' column for reporter names (NEVER 'name')
+3. ALWAYS compare issue_state with lowercase values ('open'/'closed')
+
+═══════════════════════════════════════════════════════════════════════════════
+                      EXACT QUERY → CODE MAPPINGS
+═══════════════════════════════════════════════════════════════════════════════
+
+Match your query to these patterns and USE THE EXACT CODE:
+
+┌─ COMMITS QUERIES ────────────────────────────────────────────────────────────
+│
+│ "top 5 contributors by commit count" OR "top contributors":
+│ result = df.drop_duplicates(subset=['commit_sha']).groupby('name').size().sort_values(ascending=False).head(5).reset_index(name='commit_count')
+│
+│ "most active contributors":
+│ result = df.drop_duplicates(subset=['commit_sha']).groupby('name').size().sort_values(ascending=False).head({limit}).reset_index(name='commit_count')
+│
+│ "top 10 contributors in the past 6 months" OR "last 6 months":
+│ result = df[df['date'] >= pd.Timestamp.now(tz='UTC') - pd.DateOffset(months=6)].drop_duplicates(subset=['commit_sha']).groupby('name').size().sort_values(ascending=False).head(10).reset_index(name='commit_count')
+│
+│ "contributed to documentation" OR "documentation contributors":
+│ result = df[df['filename'].str.contains(r'README|\.md$|^docs/|CONTRIBUTING|CHANGELOG|LICENSE', case=False, na=False, regex=True)].drop_duplicates(subset=['commit_sha']).groupby('name').size().sort_values(ascending=False).head({limit}).reset_index(name='doc_commits')
+│
+│ "top five files modified the most" OR "most modified files":
+│ result = df['filename'].value_counts().head(5).reset_index(name='modification_count')
+│
+│ "unique contributors" OR "how many contributors":
+│ result = pd.DataFrame({{'unique_contributors': [df['name'].nunique()]}})
+│
+└──────────────────────────────────────────────────────────────────────────────
+
+┌─ ISSUES QUERIES ─────────────────────────────────────────────────────────────
+│
+│ "most active issue reporters" OR "who raises most issues":
+│ result = df[df['type'] == 'issue'].groupby('user_login').size().sort_values(ascending=False).head({limit}).reset_index(name='issues_reported')
+│
+│ "oldest open issues":
+│ result = df[(df['type'] == 'issue') & (df['issue_state'].str.lower() == 'open')].sort_values('created_at', ascending=True).head({limit})[['issue_num', 'title', 'user_login', 'created_at']]
+│
+│ "most commented issues":
+│ result = df[df['type'] == 'issue'].nlargest({limit}, 'comment_count')[['issue_num', 'title', 'comment_count', 'issue_state', 'user_login']]
+│
+│ "how quickly issues being closed" OR "average time to close":
+│ closed_issues = df[(df['type'] == 'issue') & (df['issue_state'].str.lower() == 'closed')].copy()
+│ closed_issues['time_to_close'] = (pd.to_datetime(closed_issues['updated_at']) - pd.to_datetime(closed_issues['created_at'])).dt.days
+│ result = pd.DataFrame({{'avg_days_to_close': [closed_issues['time_to_close'].mean()]}})
+│
+└──────────────────────────────────────────────────────────────────────────────
+
+DataFrame info: {len(columns)} columns, {row_count} rows
+Columns: {', '.join(columns)}
+
+CODE REQUIREMENTS:
+1. Assign final result to 'result' variable
+2. Use .head({limit}) to limit results
+3. No imports (pd is available)
+
+ADDITIONAL EXAMPLES (use these patterns):
+
+# COMMITS - Always use drop_duplicates and 'name' column:
+"Which files have the most lines added?"
+result = df.groupby('filename')['lines_added'].sum().sort_values(ascending=False).head({limit}).reset_index()
+
+"Bug fix commits per contributor?"
+result = df[df['commit_message'].str.contains('fix|bug', case=False, na=False)].drop_duplicates(subset=['commit_sha']).groupby('name').size().sort_values(ascending=False).head({limit}).reset_index(name='bug_fixes')
+
+"Commits per month?"
+result = df.drop_duplicates(subset=['commit_sha']).groupby(df['date'].dt.to_period('M')).size().reset_index(name='commits')
+
+"Which commit modified most files?"
+result = df.groupby('commit_sha').agg({{'filename': 'count', 'name': 'first', 'commit_message': 'first'}}).sort_values('filename', ascending=False).head({limit}).reset_index()
+
+# ISSUES - Always filter type='issue' and use 'user_login':
+"Bug reports by user?"
+result = df[(df['type'] == 'issue') & (df['title'].str.contains('bug', case=False, na=False))].groupby('user_login').size().sort_values(ascending=False).head({limit}).reset_index(name='bug_reports')
+
+"Stale issues (open >6 months)?"
+result = df[(df['type'] == 'issue') & (df['issue_state'].str.lower() == 'open') & (pd.to_datetime(df['created_at']) < pd.Timestamp.now(tz='UTC') - pd.DateOffset(months=6))].head({limit})[['issue_num', 'title', 'user_login', 'created_at']]
+
+"Issue closure rate?"
+issues_only = df[df['type'] == 'issue']
+total = len(issues_only)
+closed = len(issues_only[issues_only['issue_state'].str.lower() == 'closed'])
+result = pd.DataFrame({{'total_issues': [total], 'closed_issues': [closed], 'closure_rate_pct': [(closed/total)*100 if total > 0 else 0]}})
+
+"""
+
+
 class CSVDataEngine:
     """
     Engine for querying commits and issues CSV data
@@ -24,10 +201,51 @@ class CSVDataEngine:
     - Contributor analysis
     """
 
+    # Blacklist of dangerous operations in generated pandas code
+    DANGEROUS_CODE_PATTERNS = (
+        r'\bexec\b', r'\beval\b', r'\b__import__\b',
+        r'\bopen\b', r'\bfile\b', r'\bos\.', r'\bsys\.',
+        r'\bsubprocess\b', r'\bshutil\b', r'\bpickle\b',
+        r'\bimport\b', r'\bfrom\s+\w+\s+import\b',
+        r'__.*__',  # Dunder methods
+    )
+
+    # All patterns as one alternation: a single scan of the code per check.
+    # Group "p<i>" identifies which pattern matched, for the log message
+    _DANGEROUS_CODE_RE = re.compile(
+        "|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(DANGEROUS_CODE_PATTERNS)),
+        re.IGNORECASE,
+    )
+
+    # pandas methods that write to a path or buffer (read_* is rejected too)
+    FILE_IO_METHODS = frozenset({
+        "to_csv", "to_pickle", "to_parquet", "to_feather", "to_orc", "to_excel",
+        "to_json", "to_html", "to_xml", "to_sql", "to_hdf", "to_stata",
+        "to_latex", "to_markdown", "to_clipboard",
+    })
+
+    # Generated pandas code kept per (data type, schema, query, limit)
+    CODE_CACHE_SIZE = 512
+
+    # Results of LLM queries kept per loaded frame (see query_with_llm)
+    RESULT_CACHE_SIZE = 64
+
+    # Generated code relative to the current time ("last week", "past 6
+    # months"); its results change with the clock, not just with the data
+    _CLOCK_RE = re.compile(r'\b(?:now|today|utcnow)\b', re.IGNORECASE)
+
+    # Bump when the CSV normalization changes, so older Parquet sidecars
+    # (written with the previous column set/dtypes) are ignored
+    PARQUET_CACHE_VERSION = 3
+
+    # Markdown code fence (plain or ```python) around LLM-generated code
+    _FENCE_RE = re.compile(r'```(?:python)?[ \t]*\n(.*?)```', re.DOTALL)
+
     def __init__(self, llm_client=None):
         """Initialize CSV data engine with in-memory storage"""
-        # In-memory cache: {project_id: {"commits": df, "issues": df}}
-        self.data_cache: Dict[str, Dict[str, pd.DataFrame]] = {}
+        # In-memory cache: {project_id: {"commits": df, "issues": df}}, plus
+        # views derived from them under "<data_type>:<view>" keys
+        self.data_cache: Dict[str, Dict[str, Any]] = {}
 
         # Track fetch status: {project_id: {"commits": {"status": "fetching"|"ready"|"failed", "started_at": datetime, "error": str}, "issues": {...}}}
         self.data_fetching_status: Dict[str, Dict[str, Dict]] = {}
@@ -35,8 +253,13 @@ class CSVDataEngine:
         # LLM client for dynamic query generation
         self.llm_client = llm_client
 
-        # Store last generated pandas code for retrieval
-        self.last_generated_code = ""
+        # LRU cache of validated, compiled LLM-generated code
+        self._code_cache: "OrderedDict[Tuple, Tuple[str, CodeType]]" = OrderedDict()
+        # Guards the code cache and the per-frame result caches
+        self._code_cache_lock = threading.Lock()
+
+        # Serializes _set_frame's copy-and-swap of a project's dict
+        self._frames_lock = threading.Lock()
 
         logger.info("CSV Data Engine initialized (in-memory storage)")
 
@@ -82,6 +305,78 @@ class CSVDataEngine:
             return int(elapsed)
         return None
 
+    def _set_frame(self, project_id: str, data_type: str, df: pd.DataFrame):
+        """
+        Store a project's commits/issues frame, dropping views derived from the old one
+
+        The project's dict is replaced rather than edited in place: queries
+        work on the dict they looked up, so they never see a new frame next
+        to views of the old one, and views they build from the old frame
+        land in the discarded dict.
+        """
+        prefix = f"{data_type}:"
+        with self._frames_lock:
+            project_data = {
+                key: value
+                for key, value in self.data_cache.get(project_id, {}).items()
+                if not key.startswith(prefix)
+            }
+            project_data[data_type] = df
+            self.data_cache[project_id] = project_data
+
+    @staticmethod
+    def _derived(project_data: Dict[str, Any], key: str, build) -> Any:
+        """
+        Get a view derived from a project's data, building it on first use
+
+        Derived views (frames, indexes, schema info) are kept in data_cache
+        next to their source (see _set_frame), so repeated queries reuse
+        them and a reload or data_cache.clear() discards them.
+        """
+        view = project_data.get(key)
+        if view is None:
+            view = project_data[key] = build()
+        return view
+
+    @staticmethod
+    def _sort_desc(df: pd.DataFrame, by: str, columns: List[str],
+                   rows: Optional[pd.Series] = None) -> pd.DataFrame:
+        """
+        df[columns] sorted by `by` column, newest first (missing values last)
+
+        Its head(limit) holds the same rows as nlargest(limit, by) on the
+        unsorted frame, including missing values once the rest run out.
+
+        `rows` optionally selects rows by boolean mask; it is applied together
+        with the column selection, so only the needed columns are copied.
+        """
+        if by not in columns:
+            columns = columns + [by]
+        view = df.loc[rows, columns] if rows is not None else df[columns]
+        return view.sort_values(by, ascending=False, kind='stable', na_position='last')
+
+    @staticmethod
+    def _value_index(df: pd.DataFrame, column: str) -> pd.Series:
+        """Inverted index of a column: distinct value -> row positions (ascending)"""
+        return pd.Series(df.groupby(column, sort=False).indices, dtype=object)
+
+    def _head_contains(self, project_data: Dict[str, Any], data_type: str, df: pd.DataFrame,
+                       column: str, pattern: str, limit: int) -> pd.DataFrame:
+        """
+        First `limit` rows whose `column` contains `pattern` (case-insensitive)
+
+        Same rows as df[df[column].str.contains(pattern, case=False,
+        na=False)].head(limit), but the pattern is only matched against the
+        column's distinct values, via an inverted index built on first use.
+        """
+        index = self._derived(project_data, f"{data_type}:index:{column}",
+                              lambda: self._value_index(df, column))
+        matches = index[index.index.str.contains(pattern, case=False, na=False)]
+        if matches.empty:
+            return df.iloc[:0]
+        positions = np.sort(np.concatenate(matches.to_list()))
+        return df.iloc[positions[:limit]]
+
     def load_project_data(self, project_id: str, commits_path: Optional[str] = None,
                          issues_path: Optional[str] = None) -> Dict[str, bool]:
         """
@@ -100,52 +395,34 @@ class CSVDataEngine:
         if project_id not in self.data_cache:
             self.data_cache[project_id] = {}
 
+        # Read both files concurrently: the arrow CSV reader and Parquet
+        # decoding release the GIL
+        loads = {}
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if commits_path and Path(commits_path).exists():
+                loads["commits"] = executor.submit(
+                    self._load_csv, Path(commits_path), self._parse_commits_csv
+                )
+            if issues_path and Path(issues_path).exists():
+                loads["issues"] = executor.submit(
+                    self._load_csv, Path(issues_path), self._parse_issues_csv
+                )
+
         # Load commits CSV
-        if commits_path and Path(commits_path).exists():
+        if "commits" in loads:
             try:
-                # Read CSV with actual headers
-                df = pd.read_csv(commits_path)
-
-                # Convert date columns to datetime
-                if 'date' in df.columns:
-                    df['date'] = pd.to_datetime(df['date'], utc=True, errors='coerce')
-                if 'date_time' in df.columns:
-                    df['date_time'] = pd.to_datetime(df['date_time'], utc=True, errors='coerce')
-
-                # timestamp might already exist in CSV, otherwise create alias
-                if 'timestamp' not in df.columns and 'date_time' in df.columns:
-                    df['timestamp'] = df['date_time']
-
-                self.data_cache[project_id]["commits"] = df
+                df = loads["commits"].result()
+                self._set_frame(project_id, "commits", df)
                 result["commits_loaded"] = True
                 logger.info(f"✅ Loaded {len(df)} commits for {project_id}")
             except Exception as e:
                 logger.error(f"Error loading commits CSV: {e}")
 
         # Load issues CSV
-        if issues_path and Path(issues_path).exists():
+        if "issues" in loads:
             try:
-                df = pd.read_csv(issues_path)
-
-                # Normalize column names for compatibility
-                column_mapping = {
-                    'number': 'issue_num',
-                    'state': 'issue_state',
-                    'author': 'user_login',
-                }
-                df = df.rename(columns=column_mapping)
-
-                # Convert date columns
-                if 'created_at' in df.columns:
-                    df['created_at'] = pd.to_datetime(df['created_at'], utc=True, errors='coerce')
-                if 'updated_at' in df.columns:
-                    df['updated_at'] = pd.to_datetime(df['updated_at'], utc=True, errors='coerce')
-
-                # Add type column if missing (assume all are issues if not specified)
-                if 'type' not in df.columns:
-                    df['type'] = 'issue'
-
-                self.data_cache[project_id]["issues"] = df
+                df = loads["issues"].result()
+                self._set_frame(project_id, "issues", df)
                 result["issues_loaded"] = True
                 logger.info(f"✅ Loaded {len(df)} issues for {project_id}")
             except Exception as e:
@@ -153,6 +430,174 @@ class CSVDataEngine:
 
         return result
 
+    def _load_csv(self, csv_path: Path, parse) -> pd.DataFrame:
+        """
+        Load a CSV file through its Parquet sidecar
+
+        The first load parses the CSV (tokenizing and date parsing dominate
+        load time) and writes the typed result next to it as
+        `<name>.v<PARQUET_CACHE_VERSION>.parquet`. Later loads read the
+        sidecar instead, as long as it is at least as new as the CSV.
+
+        Args:
+            csv_path: Path to the CSV file
+            parse: Function parsing the CSV into a normalized DataFrame
+
+        Returns:
+            Loaded DataFrame
+        """
+        parquet_path = csv_path.with_suffix(f".v{self.PARQUET_CACHE_VERSION}.parquet")
+        try:
+            if parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+                return pd.read_parquet(parquet_path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable Parquet cache {parquet_path}: {e}")
+
+        df = parse(csv_path)
+
+        # Best effort: without pyarrow, or in a read-only data dir, the CSV
+        # is simply parsed again next time
+        try:
+            # Write to a temp file and rename it into place, so concurrent
+            # loads of the same CSV never read a half-written sidecar
+            fd, tmp_path = tempfile.mkstemp(dir=parquet_path.parent, suffix=".tmp")
+            os.close(fd)
+            try:
+                df.to_parquet(tmp_path, compression="zstd", index=False)
+                os.replace(tmp_path, parquet_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.debug(f"Could not write Parquet cache {parquet_path}: {e}")
+
+        return df
+
+    @staticmethod
+    def _read_csv(csv_path: Path) -> pd.DataFrame:
+        """
+        Read a CSV file, using pyarrow's multithreaded reader when installed
+
+        Only the parser changes: columns still come back as regular
+        numpy-backed pandas dtypes, which LLM-generated code relies on.
+        """
+        try:
+            return pd.read_csv(csv_path, engine="pyarrow")
+        except ImportError:
+            return pd.read_csv(csv_path)
+
+    @staticmethod
+    def _to_utc(values: pd.Series) -> pd.Series:
+        """
+        Convert a date column to UTC datetimes
+
+        Columns that are already UTC datetimes (the pyarrow CSV reader
+        parses ISO 8601 timestamps itself) are returned as-is instead of
+        being converted again.
+        """
+        if isinstance(values.dtype, pd.DatetimeTZDtype) and str(values.dtype.tz) == "UTC":
+            return values
+        return pd.to_datetime(values, utc=True, errors='coerce')
+
+    @staticmethod
+    def _parse_commits_csv(commits_path: Path) -> pd.DataFrame:
+        """Read a commits CSV and convert its date columns"""
+        # Read CSV with actual headers
+        df = CSVDataEngine._read_csv(commits_path)
+
+        # Convert date columns to datetime
+        if 'date' in df.columns:
+            df['date'] = CSVDataEngine._to_utc(df['date'])
+        if 'date_time' in df.columns:
+            df['date_time'] = CSVDataEngine._to_utc(df['date_time'])
+
+        # timestamp might already exist in CSV, otherwise create alias
+        if 'timestamp' not in df.columns and 'date_time' in df.columns:
+            df['timestamp'] = df['date_time']
+
+        return CSVDataEngine._downcast_counts(df, ('lines_added', 'lines_deleted'))
+
+    @staticmethod
+    def _parse_issues_csv(issues_path: Path) -> pd.DataFrame:
+        """Read an issues CSV, normalizing column names and date columns"""
+        df = CSVDataEngine._read_csv(issues_path)
+
+        # Normalize column names for compatibility
+        column_mapping = {
+            'number': 'issue_num',
+            'state': 'issue_state',
+            'author': 'user_login',
+        }
+        df = df.rename(columns=column_mapping)
+
+        # Convert date columns
+        if 'created_at' in df.columns:
+            df['created_at'] = CSVDataEngine._to_utc(df['created_at'])
+        if 'updated_at' in df.columns:
+            df['updated_at'] = CSVDataEngine._to_utc(df['updated_at'])
+
+        # Add type column if missing (assume all are issues if not specified)
+        if 'type' not in df.columns:
+            df['type'] = 'issue'
+
+        df = CSVDataEngine._normalize_issue_states(df)
+        df = CSVDataEngine._downcast_counts(df, ('issue_num',))
+        return CSVDataEngine._add_comment_counts(df)
+
+    @staticmethod
+    def _normalize_issue_states(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Lowercase issue_state once at load time ("OPEN" -> "open")
+
+        Queries then compare states directly instead of lowercasing every
+        row on every query. The column stays a plain string column: generated
+        code groups on it, and on pandas 2.x a categorical groupby or
+        value_counts adds zero-count rows for unobserved categories.
+        """
+        if 'issue_state' in df.columns:
+            states = df['issue_state']
+            # An all-empty state column is read as float NaN
+            if not pd.api.types.is_numeric_dtype(states):
+                df['issue_state'] = states.str.lower()
+        return df
+
+    @staticmethod
+    def _add_comment_counts(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add a comment_count column counting each issue's comment rows
+
+        Computed once at load time so "most commented" queries (predefined
+        or LLM-generated) are a plain nlargest. A comment_count supplied by
+        the data source is kept when there are no comment rows to count.
+        """
+        is_comment = df['type'] == 'comment'
+        if is_comment.any():
+            counts = df.loc[is_comment].groupby('issue_num', sort=False).size()
+            df['comment_count'] = df['issue_num'].map(counts).fillna(0).astype('int32')
+        elif 'comment_count' not in df.columns:
+            df['comment_count'] = 0
+        return df
+
+    @staticmethod
+    def _downcast_counts(df: pd.DataFrame, columns: Tuple[str, ...]) -> pd.DataFrame:
+        """
+        Store int64 count/id columns as int32 when all their values fit
+
+        Halves their memory and the bandwidth of scans over them. Sums,
+        cumulative sums and groupby sums still accumulate in int64, so
+        totals do not overflow. Columns with missing values (float64) are
+        left as they are.
+        """
+        limits = np.iinfo(np.int32)
+        for column in columns:
+            if column in df.columns and df[column].dtype == np.int64:
+                values = df[column]
+                if values.empty or (values.min() >= limits.min and values.max() <= limits.max):
+                    df[column] = values.astype(np.int32)
+        return df
+
     def load_from_api_data(self, project_id: str, api_data: Dict) -> Dict:
         """
         Load commits and issues data from API response (JSON format)
@@ -198,11 +643,11 @@ class CSVDataEngine:
 
                 # Convert date columns to datetime
                 if 'date' in df.columns:
-                    df['date'] = pd.to_datetime(df['date'], utc=True, errors='coerce')
+                    df['date'] = self._to_utc(df['date'])
                 if 'date_time' in df.columns:
-                    df['date_time'] = pd.to_datetime(df['date_time'], utc=True, errors='coerce')
+                    df['date_time'] = self._to_utc(df['date_time'])
                 elif 'timestamp' in df.columns:
-                    df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True, errors='coerce')
+                    df['timestamp'] = self._to_utc(df['timestamp'])
 
                 # Create timestamp alias if not exists
                 if 'timestamp' not in df.columns and 'date' in df.columns:
@@ -215,8 +660,9 @@ class CSVDataEngine:
                     df['lines_added'] = 0
                 if 'lines_deleted' not in df.columns:
                     df['lines_deleted'] = 0
+                df = self._downcast_counts(df, ('lines_added', 'lines_deleted'))
 
-                self.data_cache[project_id]["commits"] = df
+                self._set_frame(project_id, "commits", df)
                 result["commits_loaded"] = True
                 result["commits_count"] = len(df)
                 logger.info(f"✅ Loaded {len(df)} commits from API data for {project_id}")
@@ -243,9 +689,9 @@ class CSVDataEngine:
 
                 # Convert date columns
                 if 'created_at' in df.columns:
-                    df['created_at'] = pd.to_datetime(df['created_at'], utc=True, errors='coerce')
+                    df['created_at'] = self._to_utc(df['created_at'])
                 if 'updated_at' in df.columns:
-                    df['updated_at'] = pd.to_datetime(df['updated_at'], utc=True, errors='coerce')
+                    df['updated_at'] = self._to_utc(df['updated_at'])
 
                 # Add type column if missing (assume all are issues if not specified)
                 if 'type' not in df.columns:
@@ -255,7 +701,11 @@ class CSVDataEngine:
                 if 'issue_num' not in df.columns and 'number' in df.columns:
                     df['issue_num'] = df['number']
 
-                self.data_cache[project_id]["issues"] = df
+                df = self._normalize_issue_states(df)
+                df = self._downcast_counts(df, ('issue_num',))
+                df = self._add_comment_counts(df)
+
+                self._set_frame(project_id, "issues", df)
                 result["issues_loaded"] = True
                 result["issues_count"] = len(df)
                 logger.info(f"✅ Loaded {len(df)} issues from API data for {project_id}")
@@ -265,7 +715,7 @@ class CSVDataEngine:
         return result
 
     def query_with_llm(self, project_id: str, query: str, data_type: str = "commits",
-                       limit: int = 10) -> Tuple[pd.DataFrame, str]:
+                       limit: int = 10) -> Tuple[pd.DataFrame, str, str]:
         """
         Use LLM to generate and execute pandas code for custom queries
 
@@ -276,228 +726,88 @@ class CSVDataEngine:
             limit: Maximum results to return
 
         Returns:
-            (results_df, summary_text)
-
-        Note: The generated pandas code is stored in self.last_generated_code
+            (results_df, summary_text, generated_code); generated_code is
+            empty if no code was generated
         """
-        # Initialize last generated code
-        self.last_generated_code = ""
         if not self.llm_client:
             logger.warning("LLM client not available, falling back to default query")
-            return pd.DataFrame(), "LLM query generation not available"
+            return pd.DataFrame(), "LLM query generation not available", ""
 
         # Get the DataFrame
-        if project_id not in self.data_cache or data_type not in self.data_cache[project_id]:
-            return pd.DataFrame(), f"No {data_type} data available for {project_id}"
-
-        df = self.data_cache[project_id][data_type]
+        project_data = self.data_cache.get(project_id, {})
+        if data_type not in project_data:
+            return pd.DataFrame(), f"No {data_type} data available for {project_id}", ""
+
+        df = project_data[data_type]
+
+        # Results only change when the frame is reloaded, which drops this
+        # derived cache, so a repeated query skips the LLM call and exec
+        # (code that reads the clock is not cached, see _CLOCK_RE)
+        results = self._derived(project_data, f"{data_type}:llm_results", OrderedDict)
+        result_key = (query.strip(), limit)
+        cached_result = self._get_cached_result(results, result_key)
+        if cached_result is not None:
+            generated_code, result, summary = cached_result
+            logger.info(f"Reusing LLM query result: {summary}")
+            return result, summary, generated_code
 
         # Get DataFrame schema
-        schema_info = {
+        # Computed once per loaded frame (a reload drops the cached copy)
+        schema_info = self._derived(project_data, f"{data_type}:schema", lambda: {
             "columns": list(df.columns),
             "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
             "row_count": len(df)
-        }
+        })
 
-        # Create comprehensive prompt for LLM to generate pandas code
-        # Add data-type-specific column hints with COMPLETE schema
-        if data_type == "commits":
-            schema_hint = """
-COMMITS DATA SCHEMA - ALL COLUMNS (use these EXACT column names):
-| Column          | Type    | Description                                           |
-|-----------------|---------|-------------------------------------------------------|
-| commit_sha      | string  | Unique commit identifier (use for deduplication)      |
-| name            | string  | Contributor name - USE THIS for "who" questions       |
-| email           | string  | Contributor email address                             |
-| date            | datetime| Commit timestamp (already parsed as datetime)         |
-| timestamp       | int     | Unix timestamp of commit                              |
-| filename        | string  | File path modified - USE THIS, NOT 'filepath'         |
-| change_type     | string  | 'A' (added), 'M' (modified), 'D' (deleted)           |
-| lines_added     | int     | Number of lines added in this file                    |
-| lines_deleted   | int     | Number of lines deleted in this file                  |
-| commit_message  | string  | Full commit message text                              |
-| commit_url      | string  | GitHub URL to the commit                              |
-| project         | string  | Project name                                          |
+        # Generated code only depends on the query and the DataFrame schema,
+        # so a repeated query skips the LLM call (and re-parsing the code)
+        cache_key = (data_type, tuple(schema_info["columns"]),
+                     tuple(schema_info["dtypes"].values()), query.strip(), limit)
 
-CRITICAL RULES FOR COMMITS:
-1. ONE ROW PER FILE MODIFIED, not one row per commit
-2. To count COMMITS: df.drop_duplicates(subset=['commit_sha'])
-3. To count FILE MODIFICATIONS: use df directly (no dedup)
-4. Use 'name' for contributor names, NOT 'user_login'
-5. Use 'filename' for file paths, NOT 'filepath'
-6. Use 'commit_message' for message text, NOT 'message'"""
-        else:  # issues
-            schema_hint = """
-ISSUES DATA SCHEMA - ALL COLUMNS (use these EXACT column names):
-| Column          | Type    | Description                                           |
-|-----------------|---------|-------------------------------------------------------|
-| type            | string  | 'issue' or 'comment' - FILTER BY THIS                 |
-| issue_num       | int     | Issue number (e.g., 123 for issue #123)              |
-| title           | string  | Issue title (only for type='issue')                   |
-| user_login      | string  | GitHub username - USE THIS for "who" questions        |
-| user_name       | string  | Display name of user                                  |
-| user_email      | string  | Email of user                                         |
-| user_id         | int     | GitHub user ID                                        |
-| issue_state     | string  | 'OPEN' or 'CLOSED' (uppercase, use .str.lower())     |
-| created_at      | datetime| When issue/comment was created                        |
-| updated_at      | datetime| When issue/comment was last updated                   |
-| body            | string  | Issue/comment content text                            |
-| reactions       | string  | JSON string with reaction counts                      |
-| issue_url       | string  | API URL to the issue                                  |
-| comment_url     | string  | API URL to the comment (if type='comment')           |
-| repo_name       | string  | Repository name                                       |
-
-CRITICAL RULES FOR ISSUES:
-1. Dataset has BOTH issues AND comments (check 'type' column)
-2. To count ISSUES: df[df['type'] == 'issue']
-3. To count ISSUE REPORTERS: df[df['type'] == 'issue'].groupby('user_login')
-4. Use 'user_login' for reporter names, NOT 'name'
-5. issue_state is UPPERCASE ('OPEN'/'CLOSED'), use .str.lower() for comparison
-6. Comments have issue_state=NaN, so filtering by state excludes comments"""
-
-        prompt = f"""You are a pandas expert. Generate ONLY executable pandas code (no markdown, no explanations).
-
-Query: {query}
-Data type: {data_type}
-
-{schema_hint}
-
-═══════════════════════════════════════════════════════════════════════════════
-                         MANDATORY RULES - READ FIRST
-═══════════════════════════════════════════════════════════════════════════════
-
-FOR COMMITS DATA - THESE 3 RULES ARE NON-NEGOTIABLE:
-1. ALWAYS use drop_duplicates(subset=['commit_sha']) when counting commits
-2. ALWAYS use 'name' column for contributor names (NEVER 'user_login')
-3. ALWAYS use 'filename' column for file paths (NEVER 'filepath')
-
-FOR ISSUES DATA:
-1. ALWAYS filter df[df['type'] == 'issue'] when counting issues or reporters
-2. ALWAYS use 'user_login' column for reporter names (NEVER 'name')
-3. ALWAYS use .str.lower() when comparing issue_state ('OPEN'/'CLOSED')
-
-═══════════════════════════════════════════════════════════════════════════════
-                      EXACT QUERY → CODE MAPPINGS
-═══════════════════════════════════════════════════════════════════════════════
-
-Match your query to these patterns and USE THE EXACT CODE:
-
-┌─ COMMITS QUERIES ────────────────────────────────────────────────────────────
-│
-│ "top 5 contributors by commit count" OR "top contributors":
-│ result = df.drop_duplicates(subset=['commit_sha']).groupby('name').size().sort_values(ascending=False).head(5).reset_index(name='commit_count')
-│
-│ "most active contributors":
-│ result = df.drop_duplicates(subset=['commit_sha']).groupby('name').size().sort_values(ascending=False).head({limit}).reset_index(name='commit_count')
-│
-│ "top 10 contributors in the past 6 months" OR "last 6 months":
-│ result = df[df['date'] >= pd.Timestamp.now(tz='UTC') - pd.DateOffset(months=6)].drop_duplicates(subset=['commit_sha']).groupby('name').size().sort_values(ascending=False).head(10).reset_index(name='commit_count')
-│
-│ "contributed to documentation" OR "documentation contributors":
-│ result = df[df['filename'].str.contains(r'README|\.md$|^docs/|CONTRIBUTING|CHANGELOG|LICENSE', case=False, na=False, regex=True)].drop_duplicates(subset=['commit_sha']).groupby('name').size().sort_values(ascending=False).head({limit}).reset_index(name='doc_commits')
-│
-│ "top five files modified the most" OR "most modified files":
-│ result = df['filename'].value_counts().head(5).reset_index(name='modification_count')
-│
-│ "unique contributors" OR "how many contributors":
-│ result = pd.DataFrame({{'unique_contributors': [df['name'].nunique()]}})
-│
-└──────────────────────────────────────────────────────────────────────────────
-
-┌─ ISSUES QUERIES ─────────────────────────────────────────────────────────────
-│
-│ "most active issue reporters" OR "who raises most issues":
-│ result = df[df['type'] == 'issue'].groupby('user_login').size().sort_values(ascending=False).head({limit}).reset_index(name='issues_reported')
-│
-│ "oldest open issues":
-│ result = df[(df['type'] == 'issue') & (df['issue_state'].str.lower() == 'open')].sort_values('created_at', ascending=True).head({limit})[['issue_num', 'title', 'user_login', 'created_at']]
-│
-│ "most commented issues":
-│ result = df[df['type'] == 'issue'].nlargest({limit}, 'comment_count')[['issue_num', 'title', 'comment_count', 'issue_state', 'user_login']]
-│
-│ "how quickly issues being closed" OR "average time to close":
-│ closed_issues = df[(df['type'] == 'issue') & (df['issue_state'].str.lower() == 'closed')].copy()
-│ closed_issues['time_to_close'] = (pd.to_datetime(closed_issues['updated_at']) - pd.to_datetime(closed_issues['created_at'])).dt.days
-│ result = pd.DataFrame({{'avg_days_to_close': [closed_issues['time_to_close'].mean()]}})
-│
-└──────────────────────────────────────────────────────────────────────────────
-
-DataFrame info: {len(schema_info['columns'])} columns, {schema_info['row_count']} rows
-Columns: {', '.join(schema_info['columns'])}
-
-CODE REQUIREMENTS:
-1. Assign final result to 'result' variable
-2. Use .head({limit}) to limit results
-3. No imports (pd is available)
-
-ADDITIONAL EXAMPLES (use these patterns):
-
-# COMMITS - Always use drop_duplicates and 'name' column:
-"Which files have the most lines added?"
-result = df.groupby('filename')['lines_added'].sum().sort_values(ascending=False).head({limit}).reset_index()
-
-"Bug fix commits per contributor?"
-result = df[df['commit_message'].str.contains('fix|bug', case=False, na=False)].drop_duplicates(subset=['commit_sha']).groupby('name').size().sort_values(ascending=False).head({limit}).reset_index(name='bug_fixes')
-
-"Commits per month?"
-result = df.drop_duplicates(subset=['commit_sha']).groupby(df['date'].dt.to_period('M')).size().reset_index(name='commits')
-
-"Which commit modified most files?"
-result = df.groupby('commit_sha').agg({{'filename': 'count', 'name': 'first', 'commit_message': 'first'}}).sort_values('filename', ascending=False).head({limit}).reset_index()
-
-# ISSUES - Always filter type='issue' and use 'user_login':
-"Bug reports by user?"
-result = df[(df['type'] == 'issue') & (df['title'].str.contains('bug', case=False, na=False))].groupby('user_login').size().sort_values(ascending=False).head({limit}).reset_index(name='bug_reports')
-
-"Stale issues (open >6 months)?"
-result = df[(df['type'] == 'issue') & (df['issue_state'].str.lower() == 'open') & (pd.to_datetime(df['created_at']) < pd.Timestamp.now(tz='UTC') - pd.DateOffset(months=6))].head({limit})[['issue_num', 'title', 'user_login', 'created_at']]
-
-"Issue closure rate?"
-issues_only = df[df['type'] == 'issue']
-total = len(issues_only)
-closed = len(issues_only[issues_only['issue_state'].str.lower() == 'closed'])
-result = pd.DataFrame({{'total_issues': [total], 'closed_issues': [closed], 'closure_rate_pct': [(closed/total)*100 if total > 0 else 0]}})
+        generated_code = ""
+        try:
+            cached = self._get_cached_code(cache_key)
+            if cached is not None:
+                generated_code, code = cached
+                logger.info(f"Reusing generated pandas code:\n{generated_code}")
+            else:
+                prompt = self._build_code_prompt(query, data_type, limit, schema_info)
 
-Now generate pandas code for: "{query}"
-Return ONLY executable code:"""
+                # Call LLM to generate code using configured model
+                generated_code = self.llm_client.generate_simple(
+                    prompt,
+                    max_tokens=500,
+                    temperature=0.0  # Deterministic for code generation
+                ).strip()
 
-        try:
-            # Call LLM to generate code using configured model
-            generated_code = self.llm_client.generate_simple(
-                prompt,
-                max_tokens=500,
-                temperature=0.0  # Deterministic for code generation
-            ).strip()
-
-            # Extract code from markdown blocks if present
-            if "```python" in generated_code:
-                match = re.search(r'```python\n(.*?)```', generated_code, re.DOTALL)
-                if match:
-                    generated_code = match.group(1).strip()
-            elif "```" in generated_code:
-                match = re.search(r'```\n(.*?)```', generated_code, re.DOTALL)
+                # Extract code from markdown blocks if present
+                match = self._FENCE_RE.search(generated_code)
                 if match:
                     generated_code = match.group(1).strip()
 
-            logger.info(f"Generated pandas code:\n{generated_code}")
+                logger.info(f"Generated pandas code:\n{generated_code}")
 
-            # Store the generated code for retrieval
-            self.last_generated_code = generated_code
+                # Safety check: validate the code, then its syntax tree (which
+                # is compiled directly, so the source is only parsed once)
+                if not self._is_safe_pandas_code(generated_code):
+                    logger.error("Generated code failed safety check")
+                    return pd.DataFrame(), "Generated query code failed safety validation", generated_code
+                tree = ast.parse(generated_code, "<string>")
+                if not self._is_safe_code_tree(tree):
+                    logger.error("Generated code failed safety check")
+                    return pd.DataFrame(), "Generated query code failed safety validation", generated_code
 
-            # Safety check: validate the code
-            if not self._is_safe_pandas_code(generated_code):
-                logger.error("Generated code failed safety check")
-                return pd.DataFrame(), "Generated query code failed safety validation"
+                code = compile(tree, "<string>", "exec")
 
             # Execute the generated code
             local_vars = {'df': df, 'pd': pd, 'result': None}
-            exec(generated_code, {"__builtins__": {}}, local_vars)
+            exec(code, {"__builtins__": {}}, local_vars)
 
             result = local_vars.get('result')
 
             if result is None:
                 logger.error("Execution did not produce any result")
-                return pd.DataFrame(), "Query execution failed to produce results"
+                return pd.DataFrame(), "Query execution failed to produce results", generated_code
 
             # Auto-wrap scalar results in a DataFrame (LLM sometimes forgets to wrap)
             if not isinstance(result, pd.DataFrame):
@@ -519,16 +829,73 @@ Return ONLY executable code:"""
                     logger.info(f"Auto-wrapped dict in DataFrame")
                 else:
                     logger.error(f"Execution produced unsupported type: {type(result)}")
-                    return pd.DataFrame(), f"Query execution produced unsupported type: {type(result).__name__}"
+                    return pd.DataFrame(), f"Query execution produced unsupported type: {type(result).__name__}", generated_code
+
+            self._cache_code(cache_key, generated_code, code)
 
             summary = f"LLM-generated query returned {len(result)} results"
             logger.info(f"✅ {summary}")
 
-            return result, summary
+            if not self._CLOCK_RE.search(generated_code):
+                self._cache_result(results, result_key, generated_code, result, summary)
+
+            return result, summary, generated_code
 
         except Exception as e:
             logger.error(f"Error in LLM query generation: {e}")
-            return pd.DataFrame(), f"Query execution failed: {str(e)}"
+            return pd.DataFrame(), f"Query execution failed: {str(e)}", generated_code
+
+    def _get_cached_code(self, key: Tuple) -> Optional[Tuple[str, CodeType]]:
+        """Look up previously generated (source, compiled code) for a query"""
+        with self._code_cache_lock:
+            cached = self._code_cache.get(key)
+            if cached is not None:
+                self._code_cache.move_to_end(key)
+            return cached
+
+    def _cache_code(self, key: Tuple, generated_code: str, code: CodeType):
+        """Remember generated code that passed validation and ran successfully"""
+        with self._code_cache_lock:
+            self._code_cache[key] = (generated_code, code)
+            self._code_cache.move_to_end(key)
+            while len(self._code_cache) > self.CODE_CACHE_SIZE:
+                self._code_cache.popitem(last=False)
+
+    def _get_cached_result(self, results: OrderedDict, key: Tuple) -> Optional[Tuple[str, pd.DataFrame, str]]:
+        """Look up a previous (source, result, summary) for a query on the current frame"""
+        with self._code_cache_lock:
+            cached = results.get(key)
+            if cached is not None:
+                results.move_to_end(key)
+            return cached
+
+    def _cache_result(self, results: OrderedDict, key: Tuple, generated_code: str,
+                      result: pd.DataFrame, summary: str):
+        """Remember a successful query result (callers treat results as read-only)"""
+        with self._code_cache_lock:
+            results[key] = (generated_code, result, summary)
+            results.move_to_end(key)
+            while len(results) > self.RESULT_CACHE_SIZE:
+                results.popitem(last=False)
+
+    def _build_code_prompt(self, query: str, data_type: str, limit: int,
+                           schema_info: Dict) -> str:
+        """Build the LLM prompt asking for pandas code that answers a query"""
+        # Only the query varies between calls; the multi-KB schema/examples
+        # body is built once per (data type, limit, schema, row count)
+        body = _code_prompt_body(
+            data_type, limit, tuple(schema_info["columns"]), schema_info["row_count"]
+        )
+        # The query goes last, so every prompt for a project shares the same
+        # prefix and Ollama can reuse its evaluated KV cache for it
+        return (
+            "You are a pandas expert. Generate ONLY executable pandas code (no markdown, no explanations).\n\n"
+            f"Data type: {data_type}\n\n"
+            f"{body}"
+            f"Query: {query}\n\n"
+            f'Now generate pandas code for: "{query}"\n'
+            "Return ONLY executable code:"
+        )
 
     def _is_safe_pandas_code(self, code: str) -> bool:
         """
@@ -540,19 +907,11 @@ Return ONLY executable code:"""
         Returns:
             True if code passes safety checks
         """
-        # Blacklist of dangerous operations
-        dangerous_patterns = [
-            r'\bexec\b', r'\beval\b', r'\b__import__\b',
-            r'\bopen\b', r'\bfile\b', r'\bos\.', r'\bsys\.',
-            r'\bsubprocess\b', r'\bshutil\b', r'\bpickle\b',
-            r'\bimport\b', r'\bfrom\s+\w+\s+import\b',
-            r'__.*__',  # Dunder methods
-        ]
-
-        for pattern in dangerous_patterns:
-            if re.search(pattern, code, re.IGNORECASE):
-                logger.warning(f"Dangerous pattern detected: {pattern}")
-                return False
+        match = self._DANGEROUS_CODE_RE.search(code)
+        if match:
+            pattern = self.DANGEROUS_CODE_PATTERNS[int(match.lastgroup[1:])]
+            logger.warning(f"Dangerous pattern detected: {pattern}")
+            return False
 
         # Code must create 'result' variable
         if 'result' not in code:
@@ -561,6 +920,60 @@ Return ONLY executable code:"""
 
         return True
 
+    def _is_safe_code_tree(self, tree: ast.AST) -> bool:
+        """
+        Validate the syntax tree of generated code
+
+        Catches what the text patterns cannot: pandas calls that read or
+        write files (pd.read_csv(...), df.to_pickle(...)) and access to
+        private attributes, however the code is formatted.
+
+        Args:
+            tree: Parsed generated code
+
+        Returns:
+            True if code passes safety checks
+        """
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.Import, ast.ImportFrom, ast.Global, ast.Nonlocal)):
+                logger.warning(f"Disallowed statement: {type(node).__name__}")
+                return False
+            if isinstance(node, ast.Attribute):
+                attr = node.attr
+                if attr.startswith("_") or attr.startswith("read_") or attr in self.FILE_IO_METHODS:
+                    logger.warning(f"Disallowed attribute access: .{attr}")
+                    return False
+            elif isinstance(node, ast.Name) and node.id.startswith("_") and node.id != "_":
+                logger.warning(f"Disallowed name: {node.id}")
+                return False
+
+        return True
+
+    @staticmethod
+    def _rank_contributors(df: pd.DataFrame) -> pd.DataFrame:
+        """Per-contributor commit and line totals, most commits first"""
+        # IMPORTANT: Use nunique() to count unique commits, not rows (which are per-file)
+        contributors = df.groupby(['name', 'email']).agg({
+            'commit_sha': 'nunique',  # Count unique commits, not file changes
+            'lines_added': 'sum',
+            'lines_deleted': 'sum'
+        }).rename(columns={'commit_sha': 'commit_count'})
+
+        # Line columns may be int32 (see _downcast_counts); add in int64
+        contributors['total_changes'] = contributors['lines_added'].astype(np.int64) + contributors['lines_deleted']
+        return contributors.sort_values('commit_count', ascending=False, kind='stable')
+
+    @staticmethod
+    def _commit_stats(df: pd.DataFrame) -> Dict:
+        """Overall commit statistics for a commits frame"""
+        # IMPORTANT: Count unique commits, not rows (which are per-file)
+        return {
+            'total_commits': df['commit_sha'].nunique(),
+            'unique_authors': df['email'].nunique(),
+            'total_files_changed': df['filename'].nunique(),
+            'date_range': f"{df['date'].min()} to {df['date'].max()}"
+        }
+
     def query_commits(self, project_id: str, query_type: str,
                      limit: int = 10, **kwargs) -> Tuple[pd.DataFrame, str]:
         """
@@ -582,64 +995,54 @@ Return ONLY executable code:"""
         Returns:
             (results_df, summary_text)
         """
-        if project_id not in self.data_cache or "commits" not in self.data_cache[project_id]:
+        project_data = self.data_cache.get(project_id, {})
+        if "commits" not in project_data:
             return pd.DataFrame(), f"No commits data available for {project_id}"
 
-        df = self.data_cache[project_id]["commits"]
+        df = project_data["commits"]
 
         if query_type == "latest":
             # Most recent DISTINCT commits (deduplicate by commit_sha)
-            # First get unique commits by timestamp, then take top N
-            unique_commits = df.drop_duplicates(subset=['commit_sha'], keep='first')
-            result = unique_commits.nlargest(limit, 'timestamp')[
-                ['commit_sha', 'name', 'email', 'date', 'timestamp']
-            ].sort_values('timestamp', ascending=False).drop(columns=['timestamp'])
+            # Unique commits are sorted by timestamp once, then sliced per query
+            latest = self._derived(project_data, "commits:latest", lambda: self._sort_desc(
+                df, 'timestamp', ['commit_sha', 'name', 'email', 'date'],
+                rows=~df['commit_sha'].duplicated(keep='first')
+            ))
+            result = latest.head(limit).drop(columns=['timestamp'])
             summary = f"Latest {len(result)} distinct commits"
 
         elif query_type == "by_author":
             author = kwargs.get('author', '')
-            result = df[df['name'].str.contains(author, case=False, na=False)].head(limit)
+            result = self._head_contains(project_data, "commits", df, 'name', author, limit)
             summary = f"Commits by {author}: {len(result)} found"
 
         elif query_type == "by_file":
             filename = kwargs.get('filename', '')
-            result = df[df['filename'].str.contains(filename, case=False, na=False)].head(limit)
+            result = self._head_contains(project_data, "commits", df, 'filename', filename, limit)
             summary = f"Commits affecting {filename}: {len(result)} found"
 
         elif query_type == "top_contributors":
-            # Top contributors by commit count
-            # IMPORTANT: Use nunique() to count unique commits, not rows (which are per-file)
-            contributors = df.groupby(['name', 'email']).agg({
-                'commit_sha': 'nunique',  # Count unique commits, not file changes
-                'lines_added': 'sum',
-                'lines_deleted': 'sum'
-            }).rename(columns={'commit_sha': 'commit_count'})
-
-            contributors['total_changes'] = contributors['lines_added'] + contributors['lines_deleted']
-            result = contributors.nlargest(limit, 'commit_count').sort_values('commit_count', ascending=False).reset_index()
+            # Top contributors by commit count; the full ranking is computed
+            # once per loaded frame and sliced per query
+            ranking = self._derived(project_data, "commits:top_contributors",
+                                    lambda: self._rank_contributors(df))
+            result = ranking.head(limit).reset_index()
             summary = f"Top {len(result)} contributors by commit count"
 
         elif query_type == "stats":
-            # Overall statistics
-            # IMPORTANT: Count unique commits, not rows (which are per-file)
-            total_commits = df['commit_sha'].nunique()
-            unique_authors = df['email'].nunique()
-            total_files = df['filename'].nunique()
-            date_range = f"{df['date'].min()} to {df['date'].max()}"
-
-            stats = {
-                'total_commits': total_commits,
-                'unique_authors': unique_authors,
-                'total_files_changed': total_files,
-                'date_range': date_range
-            }
+            # Overall statistics (one pass over the frame per load)
+            stats = self._derived(project_data, "commits:stats", lambda: self._commit_stats(df))
             result = pd.DataFrame([stats])
-            summary = f"Project statistics: {total_commits} commits by {unique_authors} authors"
+            summary = f"Project statistics: {stats['total_commits']} commits by {stats['unique_authors']} authors"
 
         elif query_type == "unique_contributors":
             # Count unique contributors (by name or email)
-            unique_by_name = df['name'].nunique()
-            unique_by_email = df['email'].nunique()
+            counts = self._derived(project_data, "commits:unique_contributors", lambda: {
+                'unique_contributors_by_name': df['name'].nunique(),
+                'unique_contributors_by_email': df['email'].nunique(),
+            })
+            unique_by_name = counts['unique_contributors_by_name']
+            unique_by_email = counts['unique_contributors_by_email']
 
             result = pd.DataFrame([{
                 'unique_contributors_by_name': unique_by_name,
@@ -676,64 +1079,61 @@ Return ONLY executable code:"""
         Returns:
             (results_df, summary_text)
         """
-        if project_id not in self.data_cache or "issues" not in self.data_cache[project_id]:
+        project_data = self.data_cache.get(project_id, {})
+        if "issues" not in project_data:
             return pd.DataFrame(), f"No issues data available for {project_id}"
 
-        # Filter for actual issues (not comments)
-        df = self.data_cache[project_id]["issues"]
-        issues_df = df[df['type'] == 'issue'].copy()
+        # Filter for actual issues (not comments), once per loaded frame
+        df = project_data["issues"]
+        issues_df = self._derived(project_data, "issues:issues_only", lambda: df[df['type'] == 'issue'])
 
         if query_type == "latest":
-            result = issues_df.nlargest(limit, 'created_at')[
-                ['issue_num', 'title', 'user_login', 'issue_state', 'created_at']
-            ].sort_values('created_at', ascending=False)
+            latest = self._derived(project_data, "issues:latest", lambda: self._sort_desc(
+                issues_df, 'created_at', ['issue_num', 'title', 'user_login', 'issue_state', 'created_at']
+            ))
+            result = latest.head(limit)
             summary = f"Latest {len(result)} issues"
 
         elif query_type == "open":
-            # Use case-insensitive comparison (CSV has lowercase "open")
-            open_issues = issues_df[issues_df['issue_state'].str.lower() == 'open']
-            result = open_issues.nlargest(limit, 'created_at')[
-                ['issue_num', 'title', 'user_login', 'created_at']
-            ].sort_values('created_at', ascending=False)
+            # issue_state is lowercased at load time
+            open_issues = self._derived(project_data, "issues:open", lambda: self._sort_desc(
+                issues_df, 'created_at', ['issue_num', 'title', 'user_login', 'created_at'],
+                rows=issues_df['issue_state'] == 'open'
+            ))
+            result = open_issues.head(limit)
             summary = f"Open issues: {len(result)} shown (total: {len(open_issues)})"
 
         elif query_type == "closed":
-            # Use case-insensitive comparison (CSV has lowercase "closed")
-            closed_issues = issues_df[issues_df['issue_state'].str.lower() == 'closed']
-            result = closed_issues.nlargest(limit, 'updated_at')[
-                ['issue_num', 'title', 'user_login', 'created_at', 'updated_at']
-            ].sort_values('updated_at', ascending=False)
+            closed_issues = self._derived(project_data, "issues:closed", lambda: self._sort_desc(
+                issues_df, 'updated_at', ['issue_num', 'title', 'user_login', 'created_at', 'updated_at'],
+                rows=issues_df['issue_state'] == 'closed'
+            ))
+            result = closed_issues.head(limit)
             summary = f"Closed issues: {len(result)} shown (total: {len(closed_issues)})"
 
         elif query_type == "by_user":
             user = kwargs.get('user', '')
-            result = issues_df[issues_df['user_login'].str.contains(user, case=False, na=False)].head(limit)
+            result = self._head_contains(project_data, "issues", issues_df, 'user_login', user, limit)
             summary = f"Issues by {user}: {len(result)} found"
 
         elif query_type == "most_commented":
-            # Count comments per issue
-            all_df = df.copy()
-            comment_counts = all_df[all_df['type'] == 'comment'].groupby('issue_num').size()
-            issues_df['comment_count'] = issues_df['issue_num'].map(comment_counts).fillna(0)
-
-            result = issues_df.nlargest(limit, 'comment_count')[
-                ['issue_num', 'title', 'user_login', 'comment_count', 'issue_state']
-            ].sort_values('comment_count', ascending=False)
+            # comment_count is computed at load time; rank issues by it once
+            most_commented = self._derived(project_data, "issues:most_commented", lambda: self._sort_desc(
+                issues_df, 'comment_count', ['issue_num', 'title', 'user_login', 'comment_count', 'issue_state']
+            ))
+            result = most_commented.head(limit)
             summary = f"Most commented issues: {len(result)} shown"
 
         elif query_type == "stats":
-            total_issues = len(issues_df)
-            # Use case-insensitive comparison for state (CSV has lowercase "open"/"closed")
-            open_count = len(issues_df[issues_df['issue_state'].str.lower() == 'open'])
-            closed_count = len(issues_df[issues_df['issue_state'].str.lower() == 'closed'])
-            unique_reporters = issues_df['user_login'].nunique()
-
-            stats = {
-                'total_issues': total_issues,
-                'open_issues': open_count,
-                'closed_issues': closed_count,
-                'unique_reporters': unique_reporters
-            }
+            stats = self._derived(project_data, "issues:stats", lambda: {
+                'total_issues': len(issues_df),
+                'open_issues': int((issues_df['issue_state'] == 'open').sum()),
+                'closed_issues': int((issues_df['issue_state'] == 'closed').sum()),
+                'unique_reporters': issues_df['user_login'].nunique()
+            })
+            total_issues = stats['total_issues']
+            open_count = stats['open_issues']
+            closed_count = stats['closed_issues']
             result = pd.DataFrame([stats])
             summary = f"Issue statistics: {total_issues} total ({open_count} open, {closed_count} closed)"
 
@@ -744,7 +1144,7 @@ Return ONLY executable code:"""
         return result, summary
 
     def get_context_for_query(self, project_id: str, query: str,
-                             data_type: str = "commits") -> Tuple[str, List[Dict]]:
+                             data_type: str = "commits") -> Tuple[str, List[Dict], str]:
         """
         Get formatted context for LLM based on natural language query
 
@@ -756,9 +1156,11 @@ Return ONLY executable code:"""
             data_type: "commits" or "issues"
 
         Returns:
-            (formatted_context, source_records)
+            (formatted_context, source_records, generated_code); generated_code
+            is the pandas code written by the LLM, empty for predefined queries
         """
         query_lower = query.lower()
+        generated_code = ""
 
         # Determine query type from natural language (expanded keyword matching)
         if data_type == "commits":
@@ -793,7 +1195,7 @@ Return ONLY executable code:"""
             # Temporal queries (must check BEFORE aggregation to catch "commits from last month", "pull requests from last week")
             elif any(kw in query_lower for kw in ["last month", "last week", "past month", "past week", "past year", "this quarter", "this month", "this year", "past 6 months", "past 3 months"]):
                 logger.info(f"Detected temporal query requiring date filtering, using LLM-powered pandas generation")
-                df, summary = self.query_with_llm(project_id, query, "commits", limit=100)
+                df, summary, generated_code = self.query_with_llm(project_id, query, "commits", limit=100)
 
             # Core developer queries (top contributors by commit count)
             # Handle singular vs plural for appropriate result limit
@@ -813,35 +1215,35 @@ Return ONLY executable code:"""
                 ])
                 limit = 1 if is_singular else 5
                 logger.info(f"Detected core developer query ({'singular' if is_singular else 'plural'}), returning top {limit} contributors")
-                df, summary = self.query_with_llm(project_id, query, "commits", limit=limit)
+                df, summary, generated_code = self.query_with_llm(project_id, query, "commits", limit=limit)
 
             # Aggregation queries (average, sum, patterns, trends, comparisons, unique counts)
             # Added: commit frequency, code churn, lines added
             elif any(kw in query_lower for kw in ["average", "mean", "median", "sum", "total lines", "pattern", "trend", "trending", "compare", "ratio", "percentage", "unique", "distinct", "nunique", "frequency", "churn", "lines added", "lines deleted", "code changes"]):
                 logger.info(f"Detected aggregation query requiring full dataset, using LLM-powered pandas generation")
-                df, summary = self.query_with_llm(project_id, query, "commits", limit=100)
+                df, summary, generated_code = self.query_with_llm(project_id, query, "commits", limit=100)
 
             # Filtered queries (who did X, what files with Y, etc.)
             # Note: "core developer" now handled separately above with singular/plural detection
             elif any(kw in query_lower for kw in ["documentation", "doc", "readme", "test", "bug", "feature", "fix", "focus on", "responsible for", "added or removed", "pull request", "pr "]):
                 logger.info(f"Detected filtered query requiring full dataset, using LLM-powered pandas generation")
-                df, summary = self.query_with_llm(project_id, query, "commits", limit=100)
+                df, summary, generated_code = self.query_with_llm(project_id, query, "commits", limit=100)
 
             # Top/most queries (top contributors, most lines, etc.)
             # Added: most active, which developer
             elif any(kw in query_lower for kw in ["top", "most", "highest", "largest", "biggest", "least", "smallest", "most active", "which developer"]):
                 logger.info(f"Detected ranking query requiring full dataset, using LLM-powered pandas generation")
-                df, summary = self.query_with_llm(project_id, query, "commits", limit=100)
+                df, summary, generated_code = self.query_with_llm(project_id, query, "commits", limit=100)
 
             # File queries
             elif any(kw in query_lower for kw in ["file", "files", "modified", "changed this file"]):
                 logger.info(f"Detected file query, using LLM-powered pandas generation")
-                df, summary = self.query_with_llm(project_id, query, "commits", limit=100)
+                df, summary, generated_code = self.query_with_llm(project_id, query, "commits", limit=100)
 
             # Default: use LLM for any unclassified query to ensure correctness
             else:
                 logger.info(f"Unclassified query, using LLM-powered pandas generation for safety")
-                df, summary = self.query_with_llm(project_id, query, "commits", limit=100)
+                df, summary, generated_code = self.query_with_llm(project_id, query, "commits", limit=100)
 
         else:  # issues
             # EXPANDED ISSUES HANDLING
@@ -849,12 +1251,12 @@ Return ONLY executable code:"""
             # Who raises/filed most queries (reporter ranking) - CHECK FIRST before comment queries
             if any(kw in query_lower for kw in ["who raise", "who file", "who opened", "who reported", "most active reporter", "most active issue reporter", "who are the most active issue reporters"]):
                 logger.info(f"Detected reporter ranking query, using LLM-powered pandas generation")
-                df, summary = self.query_with_llm(project_id, query, "issues", limit=100)
+                df, summary, generated_code = self.query_with_llm(project_id, query, "issues", limit=100)
 
             # Who commented queries (comment author analysis)
             elif any(kw in query_lower for kw in ["who comment", "who has commented"]):
                 logger.info(f"Detected comment author query, using LLM-powered pandas generation")
-                df, summary = self.query_with_llm(project_id, query, "issues", limit=100)
+                df, summary, generated_code = self.query_with_llm(project_id, query, "issues", limit=100)
 
             # Most commented (specific queries take priority over stats)
             elif any(kw in query_lower for kw in ["comment count", "most comment", "highest comment", "discussion"]):
@@ -869,22 +1271,22 @@ Return ONLY executable code:"""
             # Temporal queries (created this week, closed last month, etc.)
             elif any(kw in query_lower for kw in ["last month", "last week", "this week", "this month", "created", "closed last"]):
                 logger.info(f"Detected temporal issues query, using LLM-powered pandas generation")
-                df, summary = self.query_with_llm(project_id, query, "issues", limit=100)
+                df, summary, generated_code = self.query_with_llm(project_id, query, "issues", limit=100)
 
             # Closure/response time queries (need time calculations)
             elif any(kw in query_lower for kw in ["how quickly", "closure rate", "response time", "time to close"]):
                 logger.info(f"Detected time-based analysis query, using LLM-powered pandas generation")
-                df, summary = self.query_with_llm(project_id, query, "issues", limit=100)
+                df, summary, generated_code = self.query_with_llm(project_id, query, "issues", limit=100)
 
             # Filtered queries (label, priority, stale, need attention)
             elif any(kw in query_lower for kw in ["label", "priority", "high-priority", "stale", "need attention", "need help", "oldest"]):
                 logger.info(f"Detected filtered issues query, using LLM-powered pandas generation")
-                df, summary = self.query_with_llm(project_id, query, "issues", limit=100)
+                df, summary, generated_code = self.query_with_llm(project_id, query, "issues", limit=100)
 
             # Assigned queries
             elif any(kw in query_lower for kw in ["assigned", "assignee", "who assigned"]):
                 logger.info(f"Detected assignee query, using LLM-powered pandas generation")
-                df, summary = self.query_with_llm(project_id, query, "issues", limit=100)
+                df, summary, generated_code = self.query_with_llm(project_id, query, "issues", limit=100)
 
             # Recently updated
             elif any(kw in query_lower for kw in ["updated", "recently updated", "most recent"]):
@@ -928,19 +1330,23 @@ Return ONLY executable code:"""
 
         # Format as context for LLM
         if df.empty:
-            return summary, []
+            return summary, [], generated_code
 
         # Convert DataFrame to readable text
         # For LLM-generated queries, include more rows (up to 50)
         # For predefined queries, limit to 20
         max_rows = 50 if len(df) > 20 else len(df)
+        shown = df.head(max_rows)
+
+        # Tab-separated rows: as readable for the LLM as an aligned table,
+        # without to_string's per-cell width computation and padding
         context = f"{summary}\n\n"
-        context += df.to_string(index=False, max_rows=max_rows)
+        context += shown.to_csv(index=False, sep='\t')
 
         # Also return as records for citations (limit to reasonable size)
-        records = df.head(max_rows).to_dict('records')
+        records = shown.to_dict('records')
 
-        return context, records
+        return context, records, generated_code
 
     def get_available_data(self, project_id: str) -> Dict[str, bool]:
         """Check what data is available for a project"""
@@ -978,7 +1384,7 @@ Return ONLY executable code:"""
             "projects": {}
         }
 
-        for project_id, data in self.data_cache.items():
+        for project_id, data in list(self.data_cache.items()):
             # Count commits
             commits_count = len(data.get("commits", []))
 
@@ -987,7 +1393,8 @@ Return ONLY executable code:"""
             if "issues" in data and not data["issues"].empty:
                 issues_df = data["issues"]
                 if "type" in issues_df.columns:
-                    issues_count = len(issues_df[issues_df["type"] == "issue"])
+                    # Count matches without materializing the filtered frame
+                    issues_count = int(np.count_nonzero(issues_df["type"].to_numpy() == "issue"))
                 else:
                     issues_count = len(issues_df)
 
@@ -5,6 +5,9 @@ Prevents data mismatch issues in deployment
 """
 import json
 import hashlib
+import os
+import tempfile
+from collections import OrderedDict
 from typing import Dict, Optional, Tuple
 from pathlib import Path
 from loguru import logger
@@ -20,8 +23,12 @@ class DataCacheManager:
     - Validates cache freshness
     - Prevents data mismatch with hash verification
     - Supports cache invalidation and refresh
+    - Keeps recently used entries parsed in memory, checked against the file with a stat()
     """
 
+    # Maximum total size (bytes of cached JSON files) of the in-memory layer
+    MEMORY_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
     def __init__(self, cache_dir: str = "data/api_cache"):
         """
         Initialize cache manager
@@ -36,6 +43,12 @@ class DataCacheManager:
         # Can be overridden per-project if needed
         self.default_cache_ttl = 86400
 
+        # In-memory LRU layer: project_id -> [data, metadata, validated,
+        # data file (st_mtime_ns, st_size)]. A hit stats the data file and
+        # drops the entry if another worker rewrote or deleted it
+        self._memory_cache: "OrderedDict[str, list]" = OrderedDict()
+        self._memory_cache_bytes = 0
+
         logger.info(f"💾 DataCacheManager initialized: {self.cache_dir}")
 
     def get_cache_paths(self, project_id: str) -> Tuple[Path, Path]:
@@ -81,13 +94,17 @@ class DataCacheManager:
                 "issues_count": len(api_data.get("fetch_github_issues", []))
             }
 
-            # Save data
-            with open(data_file, 'w') as f:
-                json.dump(api_data, f, indent=2)
+            # Save data (compact - only read back by this class), then
+            # metadata; each file is replaced atomically so readers never
+            # see a partially written cache entry
+            data_text = json.dumps(api_data)
+            data_stat = self._atomic_write(data_file, data_text)
+            self._atomic_write(meta_file, json.dumps(metadata, indent=2))
 
-            # Save metadata
-            with open(meta_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            # Keep a private parsed copy, not the caller's dict; the hash was
+            # just computed from this data
+            self._remember(project_id, json.loads(data_text), metadata,
+                           data_stat, validated=True)
 
             logger.info(f"💾 Cached data for {project_id}: {metadata['commits_count']} commits, {metadata['issues_count']} issues")
             return True
@@ -107,9 +124,35 @@ class DataCacheManager:
         Returns:
             Tuple of (success, data, metadata)
             - success: True if data loaded and valid
-            - data: Cached data dict or None
+            - data: Cached data dict or None; it is shared with the
+              in-memory layer, so treat it as read-only
             - metadata: Cache metadata or None
         """
+        cached = self._memory_cache.get(project_id)
+        if cached is not None:
+            data, metadata, validated, file_key = cached
+            data_file, _ = self.get_cache_paths(project_id)
+            try:
+                st = os.stat(data_file)
+                current_key = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                current_key = None
+
+            if current_key != file_key:
+                # Rewritten or deleted (possibly by another worker)
+                self._forget(project_id)
+            else:
+                self._memory_cache.move_to_end(project_id)
+                if validate and not validated:
+                    if self._calculate_hash(data) != metadata.get("data_hash", ""):
+                        logger.warning(f"⚠️  Cache integrity check failed for {project_id}: hash mismatch")
+                        self._forget(project_id)
+                        return False, None, None
+                    cached[2] = True
+
+                logger.debug(f"📦 Loaded cached data for {project_id} from memory")
+                return True, data, dict(metadata)
+
         try:
             data_file, meta_file = self.get_cache_paths(project_id)
 
@@ -124,6 +167,7 @@ class DataCacheManager:
 
             # Load data
             with open(data_file, 'r') as f:
+                data_stat = os.fstat(f.fileno())
                 data = json.load(f)
 
             # Validate if requested
@@ -138,6 +182,8 @@ class DataCacheManager:
 
                 logger.debug(f"✅ Cache integrity verified for {project_id}")
 
+            self._remember(project_id, data, metadata, data_stat, validated=validate)
+
             logger.info(f"📦 Loaded cached data for {project_id}: {metadata.get('commits_count', 0)} commits, {metadata.get('issues_count', 0)} issues")
             return True, data, metadata
 
@@ -227,6 +273,8 @@ class DataCacheManager:
         Returns:
             True if cache was deleted, False otherwise
         """
+        self._forget(project_id)
+
         try:
             data_file, meta_file = self.get_cache_paths(project_id)
 
@@ -249,6 +297,44 @@ class DataCacheManager:
             logger.error(f"❌ Error invalidating cache for {project_id}: {e}")
             return False
 
+    def _remember(self, project_id: str, data: Dict, metadata: Dict,
+                  data_stat: os.stat_result, validated: bool) -> None:
+        """Store an entry in the in-memory LRU layer, evicting the oldest past the size bound"""
+        self._forget(project_id)
+        if data_stat.st_size > self.MEMORY_CACHE_MAX_BYTES:
+            return
+        file_key = (data_stat.st_mtime_ns, data_stat.st_size)
+        self._memory_cache[project_id] = [data, metadata, validated, file_key]
+        self._memory_cache_bytes += data_stat.st_size
+        while self._memory_cache_bytes > self.MEMORY_CACHE_MAX_BYTES:
+            _, evicted = self._memory_cache.popitem(last=False)
+            self._memory_cache_bytes -= evicted[3][1]
+
+    def _forget(self, project_id: str) -> None:
+        """Drop an entry from the in-memory LRU layer"""
+        entry = self._memory_cache.pop(project_id, None)
+        if entry is not None:
+            self._memory_cache_bytes -= entry[3][1]
+
+    def _atomic_write(self, path: Path, text: str) -> os.stat_result:
+        """
+        Write text to a temp file in the cache dir, then rename it over path
+
+        Returns:
+            Stat of the written file (the rename keeps its mtime and size)
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(text)
+                f.flush()
+                stat = os.fstat(f.fileno())
+            os.replace(tmp_path, path)
+            return stat
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
     def _calculate_hash(self, data: Dict) -> str:
         """
         Calculate hash of data for integrity verification
@@ -4,6 +4,7 @@ Main FastAPI application for RepoWise
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
+import os
 import sys
 
 from app.core.config import settings
@@ -31,7 +32,7 @@ app = FastAPI(
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    allow_origins=settings.cors_origins_set,
     allow_credentials=settings.cors_allow_credentials,
     allow_methods=settings.cors_allow_methods,
     allow_headers=settings.cors_allow_headers,
@@ -47,6 +48,9 @@ async def startup_event():
     """Startup event handler"""
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
 
+    # Create runtime directories (ChromaDB persistence, etc.)
+    os.makedirs(settings.chroma_persist_dir, exist_ok=True)
+
     # Initialize authentication database
     try:
         init_db()
@@ -66,6 +70,9 @@ async def shutdown_event():
     """Shutdown event handler"""
     logger.info("Shutting down application")
 
+    # Release the document extractor's pooled GitHub connections
+    routes.doc_extractor.close()
+
 
 @app.get("/")
 async def root():
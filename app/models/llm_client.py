@@ -30,6 +30,11 @@ class LLMClient:
         """Initialize Ollama client with connection pooling"""
         self.host = settings.ollama_host
         self.model = settings.ollama_model
+        self.model_spec = settings.model_spec
+        # Per-model Ollama options merged into every request
+        self._model_options = (
+            {"num_ctx": self.model_spec.ctx_len} if self.model_spec.ctx_len else {}
+        )
         self.api_endpoint = f"{self.host}/api"
 
         # Initialize shared clients if not already created
@@ -55,7 +60,10 @@ class LLMClient:
             )
             logger.info("✅ Sync connection pool initialized (10 connections)")
 
-        logger.info(f"LLM Client initialized - Model: {self.model}, Host: {self.host}")
+        logger.info(
+            f"LLM Client initialized - Model: {self.model} "
+            f"(quant={self.model_spec.quant}, ctx={self.model_spec.ctx_len}), Host: {self.host}"
+        )
 
     def _build_project_doc_prompt(
         self,
@@ -395,6 +403,7 @@ Your answer:"""
                 "top_p": 1,
                 "top_k": 1,
                 "repeat_penalty": 1.1,
+                **self._model_options,
             },
         }
 
@@ -468,6 +477,7 @@ Your answer:"""
                 "top_p": 1,
                 "top_k": 1,
                 "repeat_penalty": 1.1,
+                **self._model_options,
             },
         }
 
@@ -561,6 +571,7 @@ Your answer:"""
                 "num_predict": max_tokens,
                 "top_p": 1,
                 "top_k": 1,
+                **self._model_options,
             },
         }
 
@@ -608,6 +619,7 @@ Your answer:"""
                 "num_predict": max_tokens,
                 "top_p": 1,
                 "top_k": 1,
+                **self._model_options,
             },
         }
 
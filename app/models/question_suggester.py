@@ -145,6 +145,19 @@ class QuestionSuggester:
         ],
     }
 
+    # ========================================================================
+    # ANSWER ANALYSIS PATTERNS - compiled once at import, not per call
+    # ========================================================================
+
+    _PEOPLE_RE = re.compile(r'\b(maintainer|committee|team)\b')
+    _CLA_DCO_RE = re.compile(r'\b(cla|dco|sign|agreement)\b')
+    _HIGH_ACTIVITY_RE = re.compile(r'\b(many commits|high activity|increasing)\b')
+    _ACTIVITY_DROP_RE = re.compile(r'\b(drop|decrease|declining|fewer)\b')
+    _ISSUE_BACKLOG_RE = re.compile(r'\b(many issues|high|backlog)\b')
+    _DOCUMENTATION_RE = re.compile(r'\b(documentation|docs|readme)\b')
+    _NOT_DOCUMENTED_RE = re.compile(r'\b(not documented|not specified|not found|no information)\b')
+    _WORD_RE = re.compile(r'\w+')
+
     # ========================================================================
     # QUESTION SUGGESTION LOGIC
     # ========================================================================
@@ -364,40 +377,40 @@ class QuestionSuggester:
         refined = base_suggestions.copy()
 
         # If answer mentions specific maintainers/people → suggest how to reach them
-        if re.search(r'\b(maintainer|committee|team)\b', answer_lower):
+        if self._PEOPLE_RE.search(answer_lower):
             if intent == "GOVERNANCE":
                 refined.insert(0, "How can I reach the maintainers or governance committee?")
                 refined.insert(1, "What communication channels does the project recommend for daily coordination?")
 
         # If answer mentions CLA/DCO → suggest contribution process
-        if re.search(r'\b(cla|dco|sign|agreement)\b', answer_lower):
+        if self._CLA_DCO_RE.search(answer_lower):
             refined.insert(0, "What steps should I follow before opening a large pull request?")
 
         # If answer mentions high activity or many commits → suggest contributor analysis
-        if re.search(r'\b(many commits|high activity|increasing)\b', answer_lower):
+        if self._HIGH_ACTIVITY_RE.search(answer_lower):
             if intent == "COMMITS":
                 refined.insert(0, "Who are the top five contributors by commit count this quarter?")
                 refined.insert(1, "Which areas of the codebase receive the most frequent commits?")
 
         # If answer mentions drop in activity → suggest investigation
-        if re.search(r'\b(drop|decrease|declining|fewer)\b', answer_lower):
+        if self._ACTIVITY_DROP_RE.search(answer_lower):
             if intent == "COMMITS":
                 refined.insert(0, "Are there contributors with a sudden drop in activity that we should check in on?")
             elif intent == "ISSUES":
                 refined.insert(0, "Are our community health metrics improving or declining?")
 
         # If answer mentions high issue count → suggest triage questions
-        if re.search(r'\b(many issues|high|backlog)\b', answer_lower):
+        if self._ISSUE_BACKLOG_RE.search(answer_lower):
             if intent == "ISSUES":
                 refined.insert(0, "Are there high-priority bugs that lack assignees or recent updates?")
                 refined.insert(1, "Which pull requests or issues are at risk of falling through the cracks?")
 
         # If answer mentions documentation → suggest doc-related questions
-        if re.search(r'\b(documentation|docs|readme)\b', answer_lower):
+        if self._DOCUMENTATION_RE.search(answer_lower):
             refined.insert(0, "What documentation gaps have contributors flagged recently?")
 
         # If answer says "not documented" or "not specified" → suggest general questions
-        if re.search(r'\b(not documented|not specified|not found|no information)\b', answer_lower):
+        if self._NOT_DOCUMENTED_RE.search(answer_lower):
             if intent == "GOVERNANCE":
                 refined.insert(0, "What communication channels does the project recommend for daily coordination?")
                 refined.insert(1, "Are there 'good first issues' for new contributors?")
@@ -423,12 +436,11 @@ class QuestionSuggester:
                 unique_suggestions.append(q)
 
         # Remove questions too similar to current query
-        current_query_lower = current_query.lower()
+        query_words = set(self._WORD_RE.findall(current_query.lower()))
         filtered = []
         for q in unique_suggestions:
             # Check similarity (simple keyword overlap)
-            query_words = set(re.findall(r'\w+', current_query_lower))
-            q_words = set(re.findall(r'\w+', q.lower()))
+            q_words = set(self._WORD_RE.findall(q.lower()))
             common_words = query_words.intersection(q_words)
 
             # If more than 60% words overlap, it's too similar
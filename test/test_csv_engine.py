@@ -0,0 +1,35 @@
+"""
+Tests for the sorted views in CSVDataEngine
+
+Run with: python -m pytest test/test_csv_engine.py
+"""
+import pandas as pd
+import pytest
+
+from app.data.csv_engine import CSVDataEngine
+
+
+@pytest.fixture
+def issues():
+    return pd.DataFrame({
+        "title": ["a", "b", "c", "d"],
+        "created_at": pd.to_datetime(
+            ["2024-01-02", None, "2024-01-03", "2024-01-02"], utc=True
+        ),
+        "comment_count": [1, 3, 1, 0],
+    })
+
+
+@pytest.mark.parametrize("by", ["created_at", "comment_count"])
+@pytest.mark.parametrize("limit", [1, 2, 3, 4, 10])
+def test_sorted_head_matches_nlargest(issues, by, limit):
+    view = CSVDataEngine._sort_desc(issues, by, ["title"])
+
+    expected = issues.nlargest(limit, by)[["title", by]]
+    pd.testing.assert_frame_equal(view.head(limit), expected)
+
+
+def test_sorted_head_keeps_missing_timestamps_last(issues):
+    view = CSVDataEngine._sort_desc(issues, "created_at", ["title"])
+
+    assert list(view.head(10)["title"]) == ["c", "a", "d", "b"]
@@ -0,0 +1,119 @@
+"""
+Tests for document selection and GitHub request retries in ProjectDocExtractor
+
+Run with: python -m pytest test/test_project_doc_extractor.py
+"""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.crawler import project_doc_extractor
+from app.crawler.project_doc_extractor import (
+    ProjectDocExtractor,
+    _doc_path_rank,
+    _retry_after_seconds,
+)
+
+
+def fake_repo():
+    return SimpleNamespace(
+        full_name="owner/repo",
+        default_branch="main",
+        get_branch=lambda name: SimpleNamespace(commit=SimpleNamespace(sha="head")),
+    )
+
+
+def serve_tree(extractor, paths):
+    """Answer the extractor's GitHub API calls with a fixed recursive tree"""
+    tree = {
+        "truncated": False,
+        "tree": [
+            {"path": path, "type": "blob", "sha": f"sha-{path}", "size": 1, "url": path}
+            for path in paths
+        ],
+    }
+    extractor._http.close()
+    extractor._http = httpx.Client(
+        base_url="https://api.github.com",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=tree)),
+    )
+
+
+@pytest.fixture
+def extractor(monkeypatch):
+    extractor = ProjectDocExtractor(github_token="test-token")
+    monkeypatch.setattr(extractor, "_check_rate_limit", lambda: None)
+    yield extractor
+    extractor.close()
+
+
+@pytest.mark.parametrize("paths", [
+    ["x/LICENSE", "LICENSE.md"],
+    ["LICENSE.md", "x/LICENSE"],
+])
+def test_root_file_beats_shorter_nested_file(extractor, paths):
+    serve_tree(extractor, paths)
+    files_found, complete = extractor._extract_via_tree_api(fake_repo())
+
+    assert complete
+    assert files_found["license"]["path"] == "LICENSE.md"
+
+
+def test_shorter_path_wins_at_same_depth(extractor):
+    serve_tree(extractor, ["docs/README.rst", "a/README.md"])
+    files_found, _ = extractor._extract_via_tree_api(fake_repo())
+
+    assert files_found["readme"]["path"] == "a/README.md"
+
+
+def test_doc_path_rank_orders_by_depth_then_length():
+    assert _doc_path_rank("LICENSE.md") < _doc_path_rank("x/LICENSE")
+    assert _doc_path_rank("a/README.md") < _doc_path_rank("docs/README.rst")
+
+
+def serve_responses(extractor, responses):
+    """Answer the extractor's httpx requests with the given responses in order"""
+    responses = iter(responses)
+    extractor._http.close()
+    extractor._http = httpx.Client(
+        base_url="https://api.github.com",
+        transport=httpx.MockTransport(lambda request: next(responses)),
+    )
+
+
+def test_retry_after_seconds_parses_delay_and_http_date():
+    assert _retry_after_seconds("30") == 30
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=120)
+    assert 100 < _retry_after_seconds(format_datetime(retry_at, usegmt=True)) <= 120
+    assert _retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert _retry_after_seconds("soon") is None
+
+
+def test_get_with_retry_caps_http_date_delay(extractor, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(project_doc_extractor.time, "sleep", sleeps.append)
+    retry_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    serve_responses(extractor, [
+        httpx.Response(429, headers={"Retry-After": format_datetime(retry_at, usegmt=True)}),
+        httpx.Response(200, json={}),
+    ])
+
+    response = extractor._get_with_retry("/repos/owner/repo")
+
+    assert response.status_code == 200
+    assert sleeps == [settings.rate_limit_backoff_seconds]
+
+
+def test_get_with_retry_returns_unparseable_retry_after(extractor, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(project_doc_extractor.time, "sleep", sleeps.append)
+    serve_responses(extractor, [httpx.Response(403, headers={"Retry-After": "soon"})])
+
+    response = extractor._get_with_retry("/repos/owner/repo")
+
+    assert response.status_code == 403
+    assert sleeps == []